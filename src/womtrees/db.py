@@ -209,6 +209,22 @@ def get_connection(db_path: Path | None = None) -> sqlite3.Connection:
 
 
 def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """Create or migrate the schema unless the database is already current.
+
+    A single SELECT answers the common case; the full schema script only
+    runs for a new, emptied or older database.
+    """
+    try:
+        row = conn.execute("SELECT version FROM schema_version").fetchone()
+    except sqlite3.OperationalError:
+        row = None  # No schema_version table yet
+    if row is not None and row[0] >= SCHEMA_VERSION:
+        return
+
+    _migrate(conn)
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
     conn.executescript(SCHEMA)
     cursor = conn.execute("SELECT version FROM schema_version")
     row = cursor.fetchone()
@@ -10,9 +10,13 @@ import difflib
 import re
 import subprocess
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Literal
 
+# Unified-diff prefix character by line kind (hunk headers have none)
+_PREFIXES = {"added": "+", "removed": "-", "context": " "}
+
 
 @dataclass
 class DiffLine:
@@ -24,6 +28,18 @@ class DiffLine:
     plain_text: str  # raw text without diff prefix
     highlighted: str  # Pygments ANSI-highlighted text
 
+    @cached_property
+    def gutter(self) -> str:
+        """Old and new line-number columns, each right-aligned to 4."""
+        old_no = f"{self.old_line_no:>4}" if self.old_line_no else "    "
+        new_no = f"{self.new_line_no:>4}" if self.new_line_no else "    "
+        return f"{old_no} {new_no} "
+
+    @property
+    def prefix(self) -> str:
+        """Unified-diff prefix character for this line's kind."""
+        return _PREFIXES.get(self.kind, "")
+
 
 @dataclass
 class DiffFile:
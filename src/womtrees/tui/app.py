@@ -37,6 +37,7 @@ from womtrees.tui.dialogs import (
     RebaseDialog,
 )
 from womtrees.worktree import (
+    clear_repo_caches,
     get_current_repo,
     get_diff_stats,
     get_uncommitted_diff_stats,
@@ -187,7 +188,9 @@ class WomtreesApp(App[None]):
         finally:
             conn.close()
 
-        # Compute git stats for active items
+        # Compute git stats for active items. Repo lookups are shared within
+        # one refresh but redone on the next, in case origin/HEAD moved.
+        clear_repo_caches()
         git_stats: dict[int, GitStats] = {}
         for item in items:
             if item.status in ("working", "input", "review") and item.worktree_path:
@@ -52,6 +52,8 @@ class CommentInputDialog(ModalScreen[str | None]):
     }
     """
 
+    __slots__ = ("_comment_context", "_initial_text")
+
     def __init__(
         self, context: str = "", initial_text: str = "", **kwargs: Any
     ) -> None:
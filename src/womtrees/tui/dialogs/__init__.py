@@ -2,6 +2,7 @@
 
 from womtrees.tui.dialogs.auto_rebase import AutoRebaseDialog
 from womtrees.tui.dialogs.claude_stream import ClaudeStreamDialog
+from womtrees.tui.dialogs.confirm import ConfirmDialog
 from womtrees.tui.dialogs.create import CreateDialog
 from womtrees.tui.dialogs.delete import DeleteDialog
 from womtrees.tui.dialogs.edit import EditDialog
@@ -13,6 +14,7 @@ from womtrees.tui.dialogs.rebase import RebaseDialog
 __all__ = [
     "AutoRebaseDialog",
     "ClaudeStreamDialog",
+    "ConfirmDialog",
     "CreateDialog",
     "DeleteDialog",
     "EditDialog",
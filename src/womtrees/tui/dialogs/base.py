@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from textual.content import Content
+
+
+@lru_cache(maxsize=64)
+def cached_markup(markup: str) -> Content:
+    """Parse dialog label markup, memoized across opens.
+
+    Widgets cannot be shared between screens, but parsed ``Content`` is
+    immutable, so reopening a dialog with the same text skips the parse.
+    """
+    return Content.from_markup(markup)
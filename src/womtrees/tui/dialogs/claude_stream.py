@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Grid, Vertical
@@ -60,6 +61,19 @@ class ClaudeStreamDialog(ModalScreen[dict[str, Any] | None]):
     }
     """
 
+    __slots__ = (
+        "_title",
+        "_prompt",
+        "_cwd",
+        "_on_result",
+        "_finished",
+        "_cancelled",
+        "_result",
+        "_log",
+        "_status",
+        "_button",
+    )
+
     def __init__(
         self,
         title: str,
@@ -81,11 +95,20 @@ class ClaudeStreamDialog(ModalScreen[dict[str, Any] | None]):
         with Vertical(id="dialog"):
             yield Label(f"[bold]{self._title}[/bold]", id="title-label")
             yield Label("Running...", id="status-label")
-            yield RichLog(highlight=True, wrap=True, markup=True, id="stream-log")
+            yield RichLog(
+                highlight=True,
+                wrap=True,
+                markup=False,
+                auto_scroll=False,
+                id="stream-log",
+            )
             with Grid(classes="buttons"):
                 yield Button("Cancel", variant="error", id="cancel-btn")
 
     def on_mount(self) -> None:
+        self._log = self.query_one("#stream-log", RichLog)
+        self._status = self.query_one("#status-label", Label)
+        self._button = self.query_one("#cancel-btn", Button)
         self.run_worker(self._run_stream(), exclusive=True)
 
     async def _run_stream(self) -> None:
@@ -96,8 +119,8 @@ class ClaudeStreamDialog(ModalScreen[dict[str, Any] | None]):
             stream_claude_events,
         )
 
-        log = self.query_one("#stream-log", RichLog)
-        status = self.query_one("#status-label", Label)
+        log = self._log
+        status = self._status
 
         text_buf = ""
 
@@ -108,6 +131,9 @@ class ClaudeStreamDialog(ModalScreen[dict[str, Any] | None]):
             ):
                 if self._cancelled:
                     break
+                # Follow the tail only if the user hasn't scrolled up; scroll
+                # once per event rather than once per written line.
+                follow = log.is_vertical_scroll_end
                 if isinstance(event, ClaudeTextEvent):
                     text_buf += event.text
                     # Flush complete lines, keep partial tail in buffer
@@ -134,7 +160,7 @@ class ClaudeStreamDialog(ModalScreen[dict[str, Any] | None]):
                         detail = f"  /{inp['pattern']}/"
                     elif event.tool_name == "Skill" and inp.get("skill"):
                         detail = f"  /{inp['skill']}"
-                    log.write(f"[dim]▶ {event.tool_name}{detail}[/dim]")
+                    log.write(Text(f"▶ {event.tool_name}{detail}", style="dim"))
                 elif isinstance(event, ClaudeResultEvent):
                     if text_buf:
                         log.write(text_buf)
@@ -151,8 +177,11 @@ class ClaudeStreamDialog(ModalScreen[dict[str, Any] | None]):
                             self._result = self._on_result()
                         except Exception:
                             pass
+                if follow:
+                    log.scroll_end(animate=False)
             if text_buf:
                 log.write(text_buf)
+                log.scroll_end(animate=False)
         except Exception as exc:
             status.update(f"[red]Error: {exc}[/red]")
             self._finished = True
@@ -164,7 +193,7 @@ class ClaudeStreamDialog(ModalScreen[dict[str, Any] | None]):
             self._swap_to_close_button()
 
     def _swap_to_close_button(self) -> None:
-        btn = self.query_one("#cancel-btn", Button)
+        btn = self._button
         btn.label = "Close"
         btn.variant = "primary"
 
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Grid, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, Label
+from textual.widgets.button import ButtonVariant
+
+from womtrees.tui.dialogs.base import cached_markup
+
+
+class ConfirmDialog(ModalScreen[bool]):
+    """Yes/no confirmation dialog showing a message.
+
+    Subclasses set the confirm button via ``CONFIRM_LABEL`` and
+    ``CONFIRM_VARIANT`` and only override ``#dialog`` width/border in their
+    own ``DEFAULT_CSS``; layout and button CSS is shared from here.
+    """
+
+    CONFIRM_LABEL: ClassVar[str] = "Confirm (ctrl+s)"
+    CONFIRM_VARIANT: ClassVar[ButtonVariant] = "primary"
+
+    BINDINGS = [
+        Binding("ctrl+s,ctrl+enter", "confirm", "Confirm", show=True, priority=True),
+        Binding("escape", "cancel", "Cancel", show=False),
+    ]
+
+    DEFAULT_CSS = """
+    ConfirmDialog {
+        align: center middle;
+    }
+
+    ConfirmDialog #dialog {
+        width: 55;
+        height: auto;
+        padding: 1 2;
+        border: thick $accent;
+        background: $surface;
+    }
+
+    ConfirmDialog .buttons {
+        height: auto;
+        margin: 1 0 0 0;
+        align: center middle;
+    }
+
+    ConfirmDialog .buttons Button {
+        margin: 0 1;
+    }
+    """
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.message = message
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="dialog"):
+            yield Label(cached_markup(self.message))
+            with Grid(classes="buttons"):
+                yield Button(
+                    self.CONFIRM_LABEL,
+                    variant=self.CONFIRM_VARIANT,
+                    id="confirm",
+                )
+                yield Button("Cancel", variant="primary", id="cancel")
+
+    def action_confirm(self) -> None:
+        self.dismiss(True)
+
+    def action_cancel(self) -> None:
+        self.dismiss(False)
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "confirm":
+            self.action_confirm()
+        else:
+            self.action_cancel()
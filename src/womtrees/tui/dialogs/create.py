@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
 from typing import Any
 
 from textual.app import ComposeResult
@@ -61,6 +63,20 @@ class CreateDialog(ModalScreen[dict[str, str | None] | None]):
 
     _OTHER_SENTINEL = "__other__"
 
+    __slots__ = (
+        "mode",
+        "repos",
+        "default_repo",
+        "_path_to_name",
+        "_dialog",
+        "_repo_select",
+        "_repo_path_input",
+        "_name_input",
+        "_branch_input",
+        "_prompt_input",
+        "_submit_button",
+    )
+
     def __init__(
         self,
         mode: str = "create",
@@ -72,25 +88,23 @@ class CreateDialog(ModalScreen[dict[str, str | None] | None]):
         self.mode = mode  # "create" or "todo"
         self.repos = repos or []
         self.default_repo = default_repo
+        # Repo path -> display name. The default repo is listed first and its
+        # name wins over any other entry for the same path.
+        self._path_to_name: dict[str, str] = {}
+        if default_repo:
+            self._path_to_name[default_repo[1]] = default_repo[0]
+        for repo_name, repo_path in self.repos:
+            self._path_to_name.setdefault(repo_path, repo_name)
 
     def compose(self) -> ComposeResult:
         title = "Create & Launch" if self.mode == "create" else "Create TODO"
 
         # Build repo select options
-        options: list[tuple[str, str]] = []
+        options: list[tuple[str, str]] = [
+            (repo_name, repo_path)
+            for repo_path, repo_name in self._path_to_name.items()
+        ]
         default_value: object = Select.BLANK
-        seen = set()
-        for repo_name, repo_path in self.repos:
-            key = (repo_name, repo_path)
-            if key not in seen:
-                seen.add(key)
-                options.append((repo_name, repo_path))
-        # Ensure default repo is in the list
-        if (
-            self.default_repo
-            and (self.default_repo[0], self.default_repo[1]) not in seen
-        ):
-            options.insert(0, (self.default_repo[0], self.default_repo[1]))
         options.append(("Other...", self._OTHER_SENTINEL))
 
         if self.default_repo:
@@ -99,11 +113,7 @@ class CreateDialog(ModalScreen[dict[str, str | None] | None]):
         with Vertical(id="dialog"):
             yield Label(f"[bold]{title}[/bold]")
             yield Label("Repo:")
-            yield Select(
-                [(label, value) for label, value in options],
-                value=default_value,
-                id="repo-select",
-            )
+            yield Select(options, value=default_value, id="repo-select")
             yield Input(placeholder="/path/to/repo", id="repo-path-input")
             yield Label("Name:")
             yield Input(placeholder="Short description", id="name-input")
@@ -115,25 +125,34 @@ class CreateDialog(ModalScreen[dict[str, str | None] | None]):
                 yield Button("Submit (ctrl+s)", variant="primary", id="submit")
                 yield Button("Cancel", id="cancel")
 
+    def on_mount(self) -> None:
+        self._dialog = self.query_one("#dialog", Vertical)
+        self._repo_select = self.query_one("#repo-select", Select)
+        self._repo_path_input = self.query_one("#repo-path-input", Input)
+        self._name_input = self.query_one("#name-input", Input)
+        self._branch_input = self.query_one("#branch-input", Input)
+        self._prompt_input = self.query_one("#prompt-input", TextArea)
+        self._submit_button = self.query_one("#submit", Button)
+
     def on_select_changed(self, event: Select.Changed) -> None:
-        dialog = self.query_one("#dialog", Vertical)
         if event.value == self._OTHER_SENTINEL:
-            dialog.add_class("show-other")
-            self.query_one("#repo-path-input", Input).focus()
+            self._dialog.add_class("show-other")
+            self._repo_path_input.focus()
         else:
-            dialog.remove_class("show-other")
+            self._dialog.remove_class("show-other")
 
-    def action_submit(self) -> None:
-        from pathlib import Path
+    async def action_submit(self) -> None:
+        submit_button = self._submit_button
+        if submit_button.disabled:
+            # A previous submit is still resolving the repo path.
+            return
 
-        repo_select = self.query_one("#repo-select", Select)
-        repo_path_input = self.query_one("#repo-path-input", Input)
-        name_input = self.query_one("#name-input", Input)
-        branch_input = self.query_one("#branch-input", Input)
-        prompt_input = self.query_one("#prompt-input", TextArea)
-        name = name_input.value.strip() or None
+        repo_select = self._repo_select
+        repo_path_input = self._repo_path_input
+        branch_input = self._branch_input
+        name = self._name_input.value.strip() or None
         branch = branch_input.value.strip()
-        prompt = prompt_input.text.strip() or None
+        prompt = self._prompt_input.text.strip() or None
 
         # Resolve repo
         if repo_select.value == self._OTHER_SENTINEL:
@@ -141,19 +160,18 @@ class CreateDialog(ModalScreen[dict[str, str | None] | None]):
             if not raw:
                 repo_path_input.focus()
                 return
-            resolved = Path(raw).expanduser().resolve()
+            # resolve() stats every path component, which can stall on slow
+            # or network mounts — keep it off the event loop.
+            submit_button.disabled = True
+            try:
+                resolved = await asyncio.to_thread(Path(raw).expanduser().resolve)
+            finally:
+                submit_button.disabled = False
             repo_name = resolved.name
             repo_path = str(resolved)
         elif repo_select.value is not Select.BLANK:
             repo_path = str(repo_select.value)
-            # Find repo_name from our options
-            repo_name = Path(repo_path).name
-            for rn, rp in self.repos:
-                if rp == repo_path:
-                    repo_name = rn
-                    break
-            if self.default_repo and self.default_repo[1] == repo_path:
-                repo_name = self.default_repo[0]
+            repo_name = self._path_to_name.get(repo_path, Path(repo_path).name)
         else:
             repo_select.focus()
             return
@@ -176,8 +194,8 @@ class CreateDialog(ModalScreen[dict[str, str | None] | None]):
     def action_cancel(self) -> None:
         self.dismiss(None)
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "submit":
-            self.action_submit()
+            await self.action_submit()
         elif event.button.id == "cancel":
             self.action_cancel()
@@ -53,6 +53,16 @@ class EditDialog(ModalScreen[dict[str, str | None] | None]):
     }
     """
 
+    __slots__ = (
+        "item_name",
+        "item_branch",
+        "item_prompt",
+        "show_prompt",
+        "_name_input",
+        "_branch_input",
+        "_prompt_input",
+    )
+
     def __init__(
         self,
         item_name: str | None,
@@ -81,15 +91,22 @@ class EditDialog(ModalScreen[dict[str, str | None] | None]):
                 yield Button("Save (ctrl+s)", variant="primary", id="submit")
                 yield Button("Cancel", id="cancel")
 
+    def on_mount(self) -> None:
+        self._name_input = self.query_one("#name-input", Input)
+        self._branch_input = self.query_one("#branch-input", Input)
+        self._prompt_input: TextArea | None = (
+            self.query_one("#prompt-input", TextArea) if self.show_prompt else None
+        )
+
     def action_submit(self) -> None:
-        name = self.query_one("#name-input", Input).value.strip() or None
-        branch = self.query_one("#branch-input", Input).value.strip()
+        name = self._name_input.value.strip() or None
+        branch = self._branch_input.value.strip()
         if not branch:
-            self.query_one("#branch-input", Input).focus()
+            self._branch_input.focus()
             return
         result: dict[str, str | None] = {"name": name, "branch": branch}
-        if self.show_prompt:
-            prompt_text = self.query_one("#prompt-input", TextArea).text.strip()
+        if self._prompt_input is not None:
+            prompt_text = self._prompt_input.text.strip()
             result["prompt"] = prompt_text or None
         self.dismiss(result)
 
@@ -5,11 +5,16 @@ from typing import Any
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
+from textual.content import Content
 from textual.screen import ModalScreen
 from textual.widgets import Button, Label, Static
 
 from womtrees.models import GitStats, PullRequest
 
+_PR_COLORS = {"open": "green", "closed": "red", "merged": "magenta"}
+# Statuses with a live worktree branch that can be pushed or opened as a PR.
+_PUSH_STATUSES = frozenset({"working", "input", "review"})
+
 
 class GitActionsDialog(ModalScreen[str | None]):
     """Modal showing git actions for a work item."""
@@ -62,6 +67,16 @@ class GitActionsDialog(ModalScreen[str | None]):
     }
     """
 
+    __slots__ = (
+        "_branch",
+        "_status",
+        "_git_stats",
+        "_pull_requests",
+        "_needs_rebase",
+        "_info",
+        "_action_rows",
+    )
+
     def __init__(
         self,
         branch: str,
@@ -77,93 +92,80 @@ class GitActionsDialog(ModalScreen[str | None]):
         self._git_stats = git_stats
         self._pull_requests = pull_requests or []
         self._needs_rebase = needs_rebase
+        self._info = self._build_info()
+        self._action_rows = self._build_action_rows()
+
+    def _build_info(self) -> Content | None:
+        """Parse the stats/rebase/PR summary line, or None if there is none."""
+        info_parts: list[str] = []
+        if self._git_stats:
+            if self._git_stats.insertions or self._git_stats.deletions:
+                info_parts.append(
+                    f"[green]+{self._git_stats.insertions}[/] "
+                    f"[red]-{self._git_stats.deletions}[/]",
+                )
+            if self._git_stats.uncommitted:
+                uc_text = "[yellow]uncommitted"
+                if (
+                    self._git_stats.uncommitted_insertions
+                    or self._git_stats.uncommitted_deletions
+                ):
+                    uc_text += (
+                        f" +{self._git_stats.uncommitted_insertions}"
+                        f" -{self._git_stats.uncommitted_deletions}"
+                    )
+                uc_text += "[/]"
+                info_parts.append(uc_text)
+            else:
+                info_parts.append("[dim]clean[/]")
+
+        if self._needs_rebase:
+            info_parts.append("[red]rebase needed[/]")
+
+        for pr in self._pull_requests:
+            url = f" ({pr.url})" if pr.url else ""
+            pr_text = f"PR #{pr.number} {pr.status}{url}"
+            color = _PR_COLORS.get(pr.status)
+            info_parts.append(f"[{color}]{pr_text}[/]" if color else pr_text)
+
+        if not info_parts:
+            return None
+        return Content.from_markup("  ".join(info_parts))
+
+    def _build_action_rows(self) -> list[Content]:
+        """Parse the action row markup once; compose reuses the Content."""
+        can_merge = self._status == "review"
+        can_rebase = self._status == "review"
+        can_push = self._status in _PUSH_STATUSES
+        can_pull = self._status != "done"
+
+        rows = [
+            f"  [{'$accent' if can_merge else '$text-muted'}]\\[m][/]erge"
+            + ("" if can_merge else " [dim](review only)[/]"),
+            "  [dim]\\[c][/dim]ommit",
+            f"  [{'$accent' if can_rebase else '$text-muted'}]\\[r][/]ebase"
+            + ("" if can_rebase else " [dim](review only)[/]"),
+            f"  [{'$accent' if can_push else '$text-muted'}]\\[p][/]ush"
+            + ("" if can_push else " [dim](not available)[/]"),
+            f"  pul[{'$accent' if can_pull else '$text-muted'}]\\[l][/]"
+            + ("" if can_pull else " [dim](not available)[/]"),
+        ]
+
+        can_create_pr = not self._pull_requests and can_push
+        if can_create_pr:
+            rows.append("  create pr [$accent]\\[o][/]")
+
+        return [Content.from_markup(row) for row in rows]
 
     def compose(self) -> ComposeResult:
         with Vertical(id="dialog"):
             yield Label(f"[bold]Git: {self._branch}[/bold]", classes="section-title")
 
-            # Info section
-            info_parts: list[str] = []
-            if self._git_stats:
-                if self._git_stats.insertions or self._git_stats.deletions:
-                    info_parts.append(
-                        f"[green]+{self._git_stats.insertions}[/] "
-                        f"[red]-{self._git_stats.deletions}[/]",
-                    )
-                if self._git_stats.uncommitted:
-                    uc_text = "[yellow]uncommitted"
-                    if (
-                        self._git_stats.uncommitted_insertions
-                        or self._git_stats.uncommitted_deletions
-                    ):
-                        uc_text += (
-                            f" +{self._git_stats.uncommitted_insertions}"
-                            f" -{self._git_stats.uncommitted_deletions}"
-                        )
-                    uc_text += "[/]"
-                    info_parts.append(uc_text)
-                else:
-                    info_parts.append("[dim]clean[/]")
-
-            if self._needs_rebase:
-                info_parts.append("[red]rebase needed[/]")
-
-            for pr in self._pull_requests:
-                pr_text = f"PR #{pr.number} {pr.status}"
-                if pr.url:
-                    pr_text += f" ({pr.url})"
-                color = {"open": "green", "closed": "red", "merged": "magenta"}.get(
-                    pr.status,
-                    "",
-                )
-                if color:
-                    pr_text = f"[{color}]{pr_text}[/]"
-                info_parts.append(pr_text)
-
-            if info_parts:
-                yield Static("  ".join(info_parts), classes="git-info")
-
-            # Actions
-            can_merge = self._status == "review"
-            can_rebase = self._status == "review"
-            can_push = self._status in ("working", "input", "review")
-            can_pull = self._status != "done"
-
-            yield Static(
-                f"  [{'$accent' if can_merge else '$text-muted'}]\\[m][/]erge"
-                + ("" if can_merge else " [dim](review only)[/]"),
-                classes="git-action",
-            )
-            yield Static(
-                "  [dim]\\[c][/dim]ommit",
-                classes="git-action",
-            )
-            yield Static(
-                f"  [{'$accent' if can_rebase else '$text-muted'}]\\[r][/]ebase"
-                + ("" if can_rebase else " [dim](review only)[/]"),
-                classes="git-action",
-            )
-            yield Static(
-                f"  [{'$accent' if can_push else '$text-muted'}]\\[p][/]ush"
-                + ("" if can_push else " [dim](not available)[/]"),
-                classes="git-action",
-            )
-            yield Static(
-                f"  pul[{'$accent' if can_pull else '$text-muted'}]\\[l][/]"
-                + ("" if can_pull else " [dim](not available)[/]"),
-                classes="git-action",
-            )
-
-            can_create_pr = not self._pull_requests and self._status in (
-                "working",
-                "input",
-                "review",
-            )
-            if can_create_pr:
-                yield Static(
-                    "  create pr [$accent]\\[o][/]",
-                    classes="git-action",
-                )
+            if self._info is not None:
+                yield Static(self._info, classes="git-info")
+
+            for row in self._action_rows:
+                yield Static(row, classes="git-action")
 
             yield Button("Cancel (esc)", id="cancel-btn")
 
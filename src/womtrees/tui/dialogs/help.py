@@ -3,7 +3,29 @@ from __future__ import annotations
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.screen import ModalScreen
-from textual.widgets import Button, Label
+from textual.widgets import Button, Label, Static
+
+from womtrees.tui.dialogs.base import cached_markup
+
+_HELP_TEXT = "\n".join(
+    [
+        "",
+        "h/Left    Previous column",
+        "l/Right   Next column",
+        "j/Down    Next card",
+        "k/Up      Previous card",
+        "Enter     Jump to tmux session",
+        "s         Start a TODO item",
+        "e         Edit name/branch",
+        "c         Create & launch",
+        "t         Create TODO",
+        "g         Git actions (merge/commit/rebase/push/pull)",
+        "p         Create PR via Claude",
+        "d         Delete",
+        "q         Quit",
+        "",
+    ]
+)
 
 
 class HelpDialog(ModalScreen[None]):
@@ -30,24 +52,12 @@ class HelpDialog(ModalScreen[None]):
     }
     """
 
+    __slots__ = ()
+
     def compose(self) -> ComposeResult:
         with Vertical(id="dialog"):
-            yield Label("[bold]Keybindings[/bold]")
-            yield Label("")
-            yield Label("h/Left    Previous column")
-            yield Label("l/Right   Next column")
-            yield Label("j/Down    Next card")
-            yield Label("k/Up      Previous card")
-            yield Label("Enter     Jump to tmux session")
-            yield Label("s         Start a TODO item")
-            yield Label("e         Edit name/branch")
-            yield Label("c         Create & launch")
-            yield Label("t         Create TODO")
-            yield Label("g         Git actions (merge/commit/rebase/push/pull)")
-            yield Label("p         Create PR via Claude")
-            yield Label("d         Delete")
-            yield Label("q         Quit")
-            yield Label("")
+            yield Label(cached_markup("[bold]Keybindings[/bold]"))
+            yield Static(cached_markup(_HELP_TEXT))
             yield Button("Close", id="close")
 
     def on_button_pressed(self, _event: Button.Pressed) -> None:
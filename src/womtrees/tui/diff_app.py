@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import subprocess
+from bisect import bisect_left, bisect_right, insort
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +16,23 @@ from textual.widgets import Footer, Header, Input, Static, Tree
 
 from womtrees.diff import DiffFile, DiffResult, ReviewComment, compute_diff_for_file
 from womtrees.tui.diff_view import DiffView
+from womtrees.worktree import clear_repo_caches
+
+
+def _start_line(comment: ReviewComment) -> int:
+    return comment.start_line
+
+
+def _ensure_lines(repo_path: str, base_ref: str, df: DiffFile) -> None:
+    """Compute the full diff for a stub DiffFile on first access.
+
+    Both modes diff against the working tree (different base refs).
+    """
+    if not df.lines:
+        full = compute_diff_for_file(
+            repo_path, df.path, base_ref, "HEAD", uncommitted=True
+        )
+        df.lines = full.lines
 
 
 class DiffApp(App[None]):
@@ -81,9 +100,17 @@ class DiffApp(App[None]):
         self._base_ref = base_ref
         self._tmux_pane = tmux_pane
         self._comments: list[ReviewComment] = []
+        # Per-file comments sorted by start_line, kept in step with _comments
+        self._comments_by_file: dict[str, list[ReviewComment]] = {}
         self._current_file_idx: int = 0
         self._uncommitted_mode: bool = diff_result.target_ref == "working tree"
         self._poll_snapshot: tuple[str, tuple[tuple[str, float], ...]] = ("", ())
+        # File paths currently shown as leaves in the file tree, in order
+        self._tree_paths: list[str] = []
+        # Paths whose tree label currently shows the comment marker
+        self._marked_paths: set[str] = set()
+        # Comments last handed to the diff view, for skipping no-op updates
+        self._shown_comments: list[ReviewComment] = []
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -95,15 +122,21 @@ class DiffApp(App[None]):
         yield Footer()
 
     def on_mount(self) -> None:
-        tree = self.query_one("#file-tree", Tree)
+        self._file_tree: Tree[str] = self.query_one("#file-tree", Tree)
+        self._diff_view = self.query_one("#diff-view", DiffView)
+        self._search_bar = self.query_one("#search-bar", Input)
+        self._status_bar = self.query_one("#diff-status", Static)
+
+        tree = self._file_tree
         for i, df in enumerate(self._diff.files):
             tree.root.add_leaf(df.path, data=str(i))
         tree.root.expand()
+        self._tree_paths = [df.path for df in self._diff.files]
 
         if self._diff.files:
             self._load_file(0)
 
-        self.query_one("#diff-view", DiffView).focus()
+        self._diff_view.focus()
         self._update_status()
         self._poll_snapshot = self._take_snapshot()
         self.set_interval(5, self._poll_for_changes)
@@ -111,14 +144,14 @@ class DiffApp(App[None]):
     def on_key(self, event: Key) -> None:
         """Map j/k to tree navigation when tree is focused; handle search keys."""
         # Search bar key handling
-        search_bar = self.query_one("#search-bar", Input)
+        search_bar = self._search_bar
         if self.focused is search_bar:
             if event.key == "escape":
                 self._dismiss_search_bar()
                 event.prevent_default()
             return
 
-        tree = self.query_one("#file-tree", Tree)
+        tree = self._file_tree
         if self.focused is tree or (self.focused and tree in self.focused.ancestors):
             if event.key == "j":
                 tree.action_cursor_down()
@@ -129,7 +162,7 @@ class DiffApp(App[None]):
             return
 
         # When diff view is focused, n/N navigate search if active
-        diff_view = self.query_one("#diff-view", DiffView)
+        diff_view = self._diff_view
         if diff_view.has_search:
             if event.key == "n":
                 diff_view.next_match()
@@ -150,7 +183,7 @@ class DiffApp(App[None]):
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "search-bar":
             term = event.value.strip()
-            diff_view = self.query_one("#diff-view", DiffView)
+            diff_view = self._diff_view
             if term:
                 diff_view.set_search(term)
             else:
@@ -159,15 +192,15 @@ class DiffApp(App[None]):
             self._update_status()
 
     def _show_search_bar(self) -> None:
-        search_bar = self.query_one("#search-bar", Input)
+        search_bar = self._search_bar
         search_bar.add_class("visible")
         search_bar.value = ""
         search_bar.focus()
 
     def _dismiss_search_bar(self) -> None:
-        search_bar = self.query_one("#search-bar", Input)
+        search_bar = self._search_bar
         search_bar.remove_class("visible")
-        self.query_one("#diff-view", DiffView).focus()
+        self._diff_view.focus()
 
     def on_tree_node_selected(self, event: Tree.NodeSelected[str]) -> None:
         if event.node.data is not None:
@@ -178,21 +211,10 @@ class DiffApp(App[None]):
         if 0 <= idx < len(self._diff.files):
             self._current_file_idx = idx
             df = self._diff.files[idx]
-            # Lazy load: compute full diff on first access
-            # Both modes diff against working tree (different base refs)
-            if not df.lines:
-                full = compute_diff_for_file(
-                    self._repo_path,
-                    df.path,
-                    self._diff.base_ref,
-                    "HEAD",
-                    uncommitted=True,
-                )
-                df.lines = full.lines
-            diff_view = self.query_one("#diff-view", DiffView)
+            _ensure_lines(self._repo_path, self._diff.base_ref, df)
+            diff_view = self._diff_view
             diff_view.load_file(df)
-            file_comments = [c for c in self._comments if c.file == df.path]
-            diff_view.set_comments(file_comments)
+            self._show_comments(df.path, force=True)
             self.title = df.path
             self._update_status()
 
@@ -201,7 +223,7 @@ class DiffApp(App[None]):
             status_text = "No files changed"
         else:
             f = self._diff.files[self._current_file_idx]
-            diff_view = self.query_one("#diff-view", DiffView)
+            diff_view = self._diff_view
             pos = diff_view.cursor + 1
             total = len(f.lines)
             status_text = (
@@ -211,11 +233,11 @@ class DiffApp(App[None]):
                 f"{self._diff.base_ref}..{self._diff.target_ref}"
                 f"{diff_view.search_info}"
             )
-        self.query_one("#diff-status", Static).update(status_text)
+        self._status_bar.update(status_text)
 
     def _sync_tree_highlight(self, idx: int) -> None:
         """Move the file tree highlight to match the current file index."""
-        tree = self.query_one("#file-tree", Tree)
+        tree = self._file_tree
         children = list(tree.root.children)
         if 0 <= idx < len(children):
             tree.move_cursor(children[idx])
@@ -235,8 +257,8 @@ class DiffApp(App[None]):
             self._sync_tree_highlight(idx)
 
     def action_toggle_focus(self) -> None:
-        tree = self.query_one("#file-tree", Tree)
-        diff_view = self.query_one("#diff-view", DiffView)
+        tree = self._file_tree
+        diff_view = self._diff_view
         if self.focused is tree or (self.focused and tree in self.focused.ancestors):
             diff_view.focus()
         else:
@@ -276,140 +298,198 @@ class DiffApp(App[None]):
     ) -> None:
         if text is None:
             return
-        self._comments.append(
-            ReviewComment(
-                file=file,
-                start_line=start,
-                end_line=end,
-                comment_text=text,
-                source_start=source_start,
-                source_end=source_end,
-                diff_content=diff_content,
-            )
+        comment = ReviewComment(
+            file=file,
+            start_line=start,
+            end_line=end,
+            comment_text=text,
+            source_start=source_start,
+            source_end=source_end,
+            diff_content=diff_content,
         )
+        self._add_comment(comment)
         self._refresh_comments()
 
     def on_diff_view_undo_comment(self, event: DiffView.UndoComment) -> None:
         if self._comments:
-            self._comments.pop()
+            self._remove_comment(self._comments[-1])
             self._refresh_comments()
             self.notify("Removed last comment")
 
     def on_diff_view_delete_comment_at_cursor(
         self, event: DiffView.DeleteCommentAtCursor
     ) -> None:
-        if not self._diff.files:
-            return
-        current_file = self._diff.files[self._current_file_idx].path
-        diff_view = self.query_one("#diff-view", DiffView)
-        cursor = diff_view.cursor
-
-        for i, c in enumerate(self._comments):
-            if c.file == current_file and c.start_line <= cursor <= c.end_line:
-                self._comments.pop(i)
-                self._refresh_comments()
-                self.notify("Deleted comment")
-                return
+        c = self._comment_at_cursor()
+        if c is not None:
+            self._remove_comment(c)
+            self._refresh_comments()
+            self.notify("Deleted comment")
 
     def on_diff_view_edit_comment_at_cursor(
         self, event: DiffView.EditCommentAtCursor
     ) -> None:
-        if not self._diff.files:
+        c = self._comment_at_cursor()
+        if c is None:
             return
-        current_file = self._diff.files[self._current_file_idx].path
-        diff_view = self.query_one("#diff-view", DiffView)
-        cursor = diff_view.cursor
-
-        for i, c in enumerate(self._comments):
-            if c.file == current_file and c.start_line <= cursor <= c.end_line:
-                from womtrees.tui.comment_input import CommentInputDialog
+        from womtrees.tui.comment_input import CommentInputDialog
 
-                context = f"{c.file}#L{c.source_start}"
-                if c.source_start != c.source_end:
-                    context = f"{c.file}#L{c.source_start}-L{c.source_end}"
+        context = f"{c.file}#L{c.source_start}"
+        if c.source_start != c.source_end:
+            context = f"{c.file}#L{c.source_start}-L{c.source_end}"
 
-                self.push_screen(
-                    CommentInputDialog(context=context, initial_text=c.comment_text),
-                    lambda text, idx=i: self._on_edit_submitted(text, idx),
-                )
-                return
+        self.push_screen(
+            CommentInputDialog(context=context, initial_text=c.comment_text),
+            lambda text: self._on_edit_submitted(text, c),
+        )
 
-    def _on_edit_submitted(self, text: str | None, idx: int) -> None:
+    def _on_edit_submitted(self, text: str | None, old: ReviewComment) -> None:
         if text is None:
             return
         from dataclasses import replace
 
-        self._comments[idx] = replace(self._comments[idx], comment_text=text)
+        # A refresh while the dialog was open may have remapped or removed it
+        current = self._find_comment(old)
+        if current is None:
+            return
+        new = replace(current, comment_text=text)
+        self._comments[self._position_in_comments(current)] = new
+        file_comments = self._comments_by_file[current.file]
+        file_comments[self._position_in_file(current)] = new
         self._refresh_comments()
 
     def on_diff_view_navigate_comment(self, event: DiffView.NavigateComment) -> None:
         if not self._diff.files or not self._comments:
             return
         current_file = self._diff.files[self._current_file_idx].path
-        file_comments = sorted(
-            (c for c in self._comments if c.file == current_file),
-            key=lambda c: c.start_line,
-        )
+        file_comments = self._comments_by_file.get(current_file)
         if not file_comments:
             return
 
-        diff_view = self.query_one("#diff-view", DiffView)
+        diff_view = self._diff_view
         cursor = diff_view.cursor
 
         if event.direction == 1:
-            # Find next comment after cursor
-            for c in file_comments:
-                if c.start_line > cursor:
-                    diff_view._cursor_pos = c.start_line
-                    diff_view._line_cache.clear()
-                    diff_view.refresh()
-                    diff_view._scroll_to_cursor()
-                    self._update_status()
-                    return
-            # Wrap around
-            diff_view._cursor_pos = file_comments[0].start_line
-            diff_view._line_cache.clear()
-            diff_view.refresh()
-            diff_view._scroll_to_cursor()
+            # Next comment after cursor, wrapping to the first
+            i = bisect_right(file_comments, cursor, key=_start_line)
+            target = file_comments[i if i < len(file_comments) else 0]
         else:
-            # Find prev comment before cursor
-            for c in reversed(file_comments):
-                if c.start_line < cursor:
-                    diff_view._cursor_pos = c.start_line
-                    diff_view._line_cache.clear()
-                    diff_view.refresh()
-                    diff_view._scroll_to_cursor()
-                    self._update_status()
-                    return
-            # Wrap around
-            diff_view._cursor_pos = file_comments[-1].start_line
-            diff_view._line_cache.clear()
-            diff_view.refresh()
-            diff_view._scroll_to_cursor()
+            # Previous comment before cursor, wrapping to the last
+            i = bisect_left(file_comments, cursor, key=_start_line)
+            target = file_comments[i - 1]
 
+        diff_view.jump_to(target.start_line)
         self._update_status()
 
+    def _position_in_file(self, comment: ReviewComment) -> int:
+        """Return the index of ``comment`` in its file's sorted list."""
+        file_comments = self._comments_by_file[comment.file]
+        lo = bisect_left(file_comments, comment.start_line, key=_start_line)
+        hi = bisect_right(file_comments, comment.start_line, key=_start_line)
+        for i in range(lo, hi):
+            if file_comments[i] is comment:
+                return i
+        raise ValueError("comment not found")
+
+    def _position_in_comments(self, comment: ReviewComment) -> int:
+        """Return the index of ``comment`` in _comments, searching from the end."""
+        for i in range(len(self._comments) - 1, -1, -1):
+            if self._comments[i] is comment:
+                return i
+        raise ValueError("comment not found")
+
+    def _find_comment(self, comment: ReviewComment) -> ReviewComment | None:
+        """Return the live comment matching ``comment``, or None if it is gone.
+
+        _remap_comments replaces comments with moved copies, so match on the
+        fields a remap keeps rather than on identity.
+        """
+        for c in reversed(self._comments):
+            if (
+                c.file == comment.file
+                and c.diff_content == comment.diff_content
+                and c.comment_text == comment.comment_text
+            ):
+                return c
+        return None
+
+    def _comment_at_cursor(self) -> ReviewComment | None:
+        """Return the current file's comment covering the cursor, if any.
+
+        Of overlapping comments, the one starting closest above the cursor
+        wins.
+        """
+        if not self._diff.files:
+            return None
+        current_file = self._diff.files[self._current_file_idx].path
+        file_comments = self._comments_by_file.get(current_file, ())
+        cursor = self._diff_view.cursor
+        i = bisect_right(file_comments, cursor, key=_start_line)
+        for c in reversed(file_comments[:i]):
+            if cursor <= c.end_line:
+                return c
+        return None
+
+    def _add_comment(self, comment: ReviewComment) -> None:
+        """Record a new comment in _comments and the per-file index."""
+        self._comments.append(comment)
+        insort(
+            self._comments_by_file.setdefault(comment.file, []),
+            comment,
+            key=_start_line,
+        )
+
+    def _remove_comment(self, comment: ReviewComment) -> None:
+        """Drop a comment from _comments and the per-file index."""
+        del self._comments[self._position_in_comments(comment)]
+        file_comments = self._comments_by_file[comment.file]
+        del file_comments[self._position_in_file(comment)]
+        if not file_comments:
+            del self._comments_by_file[comment.file]
+
+    def _reindex_comments(self) -> None:
+        """Rebuild the per-file index from _comments."""
+        by_file: dict[str, list[ReviewComment]] = {}
+        for c in self._comments:
+            by_file.setdefault(c.file, []).append(c)
+        for file_comments in by_file.values():
+            file_comments.sort(key=_start_line)
+        self._comments_by_file = by_file
+
     def _refresh_comments(self) -> None:
         """Re-render comments for the current file."""
         if not self._diff.files:
             return
-        diff_view = self.query_one("#diff-view", DiffView)
         current_file = self._diff.files[self._current_file_idx].path
-        file_comments = [c for c in self._comments if c.file == current_file]
-        diff_view.set_comments(file_comments)
+        self._show_comments(current_file)
         self._update_status()
         self._update_tree_markers()
 
+    def _show_comments(self, path: str, force: bool = False) -> None:
+        """Pass ``path``'s comments to the diff view if they changed."""
+        comments = self._comments_by_file.get(path, [])
+        if not force and comments == self._shown_comments:
+            return
+        self._shown_comments = list(comments)
+        self._diff_view.set_comments(self._shown_comments)
+
+    def _tree_label(self, path: str) -> str:
+        marker = "\u25cf " if path in self._marked_paths else ""
+        return f"{marker}{path}"
+
     def _update_tree_markers(self) -> None:
-        """Update file tree to show comment markers."""
-        tree = self.query_one("#file-tree", Tree)
-        commented_files = {c.file for c in self._comments}
-        for node in tree.root.children:
-            if node.data is not None:
-                idx = int(node.data)
-                path = self._diff.files[idx].path
-                marker = "\u25cf " if path in commented_files else ""
-                node.set_label(f"{marker}{path}")
+        """Update file tree to show comment markers.
+
+        Only leaves whose marker flips are relabelled.
+        """
+        commented_files = self._comments_by_file.keys()
+        changed = commented_files ^ self._marked_paths
+        if not changed:
+            return
+        self._marked_paths = set(commented_files)
+        tree = self._file_tree
+        for node, path in zip(tree.root.children, self._tree_paths):
+            if path in changed:
+                node.set_label(self._tree_label(path))
 
     # -- Comment remapping --
 
@@ -478,15 +558,7 @@ class DiffApp(App[None]):
                 continue
 
             # Force lazy-load if needed
-            if not df.lines:
-                full = compute_diff_for_file(
-                    self._repo_path,
-                    df.path,
-                    self._diff.base_ref,
-                    "HEAD",
-                    uncommitted=True,
-                )
-                df.lines = full.lines
+            _ensure_lines(self._repo_path, self._diff.base_ref, df)
 
             match = self._find_content_in_diff(
                 df, comment.diff_content, comment.source_start
@@ -533,27 +605,63 @@ class DiffApp(App[None]):
         if new_snapshot == self._poll_snapshot:
             return
         self._poll_snapshot = new_snapshot
-        self._refresh_diff()
+        self.run_worker(self._refresh_diff(), group="refresh-diff", exclusive=True)
 
-    def _refresh_diff(self) -> None:
-        """Rebuild the diff in the current mode, remap comments, reload view."""
-        from womtrees.diff import list_diff_files
+    def _fetch_diff(self, uncommitted: bool, preload: set[str]) -> DiffResult:
+        """List changed files and load the ones in ``preload``.
 
-        # Remember current file path and cursor to restore position
-        current_path: str | None = None
-        cursor_pos = 0
-        if self._diff.files and self._current_file_idx < len(self._diff.files):
-            current_path = self._diff.files[self._current_file_idx].path
-            cursor_pos = self.query_one("#diff-view", DiffView).cursor
+        Runs in a worker thread; only touches the new DiffResult.
+        """
+        from womtrees.diff import list_diff_files
 
-        self._diff = list_diff_files(
+        diff = list_diff_files(
             self._repo_path,
             base_ref=self._base_ref,
-            uncommitted=self._uncommitted_mode,
+            uncommitted=uncommitted,
         )
+        for df in diff.files:
+            if df.path in preload:
+                _ensure_lines(self._repo_path, diff.base_ref, df)
+        return diff
+
+    def _current_path(self) -> str | None:
+        """Path of the file shown in the diff view, if any."""
+        if self._diff.files and self._current_file_idx < len(self._diff.files):
+            return self._diff.files[self._current_file_idx].path
+        return None
+
+    async def _refresh_diff(self) -> None:
+        """Rebuild the diff in the current mode, remap comments, reload view.
+
+        git runs in a thread so the UI stays responsive; the file tree
+        shows a loading indicator meanwhile.
+        """
+        # Load the files the view and comment remapping will need up front
+        preload = set(self._comments_by_file)
+        current_path = self._current_path()
+        if current_path:
+            preload.add(current_path)
+
+        # The default branch may have moved since the last refresh
+        clear_repo_caches()
+        tree = self._file_tree
+        tree.loading = True
+        try:
+            diff = await asyncio.to_thread(
+                self._fetch_diff, self._uncommitted_mode, preload
+            )
+        finally:
+            tree.loading = False
+
+        # Remember current file path and cursor to restore position. Read
+        # them now: the user may have kept navigating while git ran.
+        current_path = self._current_path()
+        cursor_pos = self._diff_view.cursor if current_path else 0
+        self._diff = diff
 
         if self._comments:
             self._remap_comments()
+            self._reindex_comments()
 
         # Restore file index by path
         self._current_file_idx = 0
@@ -568,14 +676,9 @@ class DiffApp(App[None]):
         if self._diff.files:
             self._load_file(self._current_file_idx)
             # Restore cursor position
-            diff_view = self.query_one("#diff-view", DiffView)
-            count = len(self._diff.files[self._current_file_idx].lines)
-            diff_view._cursor_pos = min(cursor_pos, max(0, count - 1))
-            diff_view._line_cache.clear()
-            diff_view.refresh()
-            diff_view._scroll_to_cursor()
+            self._diff_view.jump_to(cursor_pos)
         else:
-            self.query_one("#diff-view", DiffView).clear()
+            self._diff_view.clear()
 
         self._update_status()
 
@@ -584,18 +687,34 @@ class DiffApp(App[None]):
     def action_cycle_mode(self) -> None:
         """Toggle between uncommitted changes and branch diff."""
         self._uncommitted_mode = not self._uncommitted_mode
-        self._refresh_diff()
-        self._poll_snapshot = self._take_snapshot()
+        self.run_worker(self._cycle_mode(), group="refresh-diff", exclusive=True)
+
+    async def _cycle_mode(self) -> None:
+        await self._refresh_diff()
+        self._poll_snapshot = await asyncio.to_thread(self._take_snapshot)
         label = "uncommitted" if self._uncommitted_mode else "branch"
         self.notify(f"Mode: {label} ({len(self._diff.files)} files)")
 
     def _reload_tree(self) -> None:
-        """Rebuild the file tree from current diff."""
-        tree = self.query_one("#file-tree", Tree)
-        tree.root.remove_children()
-        for i, df in enumerate(self._diff.files):
-            tree.root.add_leaf(df.path, data=str(i))
-        tree.root.expand()
+        """Patch the file tree to match the current diff.
+
+        Leaves up to the first differing path are kept as-is (their index
+        data is unchanged); only the tail after that point is replaced.
+        """
+        new_paths = [df.path for df in self._diff.files]
+        if new_paths != self._tree_paths:
+            tree = self._file_tree
+            keep = 0
+            for old, new in zip(self._tree_paths, new_paths):
+                if old != new:
+                    break
+                keep += 1
+            for node in list(tree.root.children)[keep:]:
+                node.remove()
+            for i in range(keep, len(new_paths)):
+                tree.root.add_leaf(self._tree_label(new_paths[i]), data=str(i))
+            tree.root.expand()
+            self._tree_paths = new_paths
         self._update_tree_markers()
 
     # -- Submission --
@@ -617,6 +736,7 @@ class DiffApp(App[None]):
             return
         count = len(self._comments)
         self._comments.clear()
+        self._comments_by_file.clear()
         self._refresh_comments()
         self.notify(f"Cleared {count} comments")
 
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+from rich.segment import Segment
+from rich.style import Style
 from rich.text import Text
 from textual.binding import Binding
 from textual.cache import LRUCache
-from textual.events import MouseDown, MouseMove, MouseUp
+from textual.events import MouseDown, MouseMove, MouseUp, Resize
 from textual.geometry import Size
 from textual.message import Message
 from textual.scroll_view import ScrollView
 from textual.strip import Strip
+from textual.timer import Timer
 
 from womtrees.diff import DiffFile, DiffLine, ReviewComment
 
@@ -24,14 +29,63 @@ _BG_HUNK = "#1c1c1c"
 _BG_SELECTION = "#3a3a3a"
 _BG_COMMENT = "#2a2210"
 _BG_CURSOR = "#444444"
-_SEARCH_HIGHLIGHT = "black on yellow"
-_SEARCH_CURRENT = "black on #ff8800"
+_SEARCH_HIGHLIGHT = Style.parse("black on yellow")
+_SEARCH_CURRENT = Style.parse("black on #ff8800")
 
 # Gutter styling
-_GUTTER_STYLE = "dim"
-_PREFIX_ADDED = "bold green"
-_PREFIX_REMOVED = "bold red"
-_HUNK_STYLE = "bold cyan"
+_GUTTER_STYLE = Style.parse("dim")
+_PREFIX_ADDED = Style.parse("bold green")
+_PREFIX_REMOVED = Style.parse("bold red")
+_HUNK_STYLE = Style.parse("bold cyan")
+_MARKER_STYLE = Style.parse("yellow")
+_PREFIX_STYLES: dict[str, Style] = {
+    "added": _PREFIX_ADDED,
+    "removed": _PREFIX_REMOVED,
+}
+
+# Comment marker column, as ready-made segments
+_MARKER_SEGMENT = Segment("\u25cf ", _MARKER_STYLE)
+_NO_MARKER_SEGMENT = Segment("  ", Style())
+
+# Line background by kind, before selection/comment/cursor overlays
+_KIND_BG: dict[str, str | None] = {
+    "added": _BG_ADDED,
+    "removed": _BG_REMOVED,
+    "hunk_header": _BG_HUNK,
+    "context": None,
+}
+
+# Overlay styles by background, plain and with the cursor on the line
+_BG_STYLES: dict[str, Style] = {
+    bg: Style(bgcolor=bg)
+    for bg in (_BG_ADDED, _BG_REMOVED, _BG_HUNK, _BG_SELECTION, _BG_COMMENT)
+}
+_CURSOR_STYLES: dict[str, Style] = {
+    bg: Style(bgcolor=bg, bold=True, underline=True) for bg in (*_BG_STYLES, _BG_CURSOR)
+}
+
+# Minimum interval between cursor updates while drag-selecting (~one frame)
+_DRAG_INTERVAL = 1 / 60
+
+# Line caches hold this many screens of rows, with a floor for tiny views
+_CACHE_SCREENS = 4
+_MIN_CACHE_SIZE = 256
+
+# Columns before the code: comment marker, then (for code lines) gutter + prefix
+_MARKER_WIDTH = 2
+_CODE_OFFSET = _MARKER_WIDTH + 10 + 1
+
+
+# Shared across views and file loads. Kept small: the current file's parsed
+# lines are already held per view in DiffView._parsed_code.
+@lru_cache(maxsize=4096)
+def _parse_ansi(highlighted: str) -> Text:
+    """Parse a highlighted line, shared between lines with the same source.
+
+    The returned Text is shared and must not be mutated; callers copy it
+    into their own Text with ``append_text``.
+    """
+    return Text.from_ansi(highlighted)
 
 
 class DiffView(ScrollView):
@@ -98,14 +152,36 @@ class DiffView(ScrollView):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._diff_file: DiffFile | None = None
+        # Parsed ANSI code per line, filled in on first render
+        self._parsed_code: list[Text | None] = []
+        # Gutter + prefix (or the styled hunk header) per line, built on demand
+        self._line_chrome: list[Text | None] = []
+        # Sorted indices of hunk header lines
+        self._hunk_indices: list[int] = []
+        # Rendered chrome + code segments per line, built on demand
+        self._line_segments: list[list[Segment] | None] = []
         self._cursor_pos: int = 0
         self._selection_anchor: int | None = None
+        # Latest drag position not yet applied, and the timer that applies it
+        self._drag_cursor: int | None = None
+        self._drag_timer: Timer | None = None
         self._file_comments: list[ReviewComment] = []
-        self._commented_lines: set[int] = set()
-        self._line_cache: LRUCache[tuple[object, ...], Strip] = LRUCache(2048)
+        # Commented line ranges as merged, disjoint (start, end) intervals,
+        # split into parallel sorted lists for bisect
+        self._comment_starts: list[int] = []
+        self._comment_ends: list[int] = []
+        # Unstyled line content (marker, gutter, prefix, code), padded to width
+        self._base_strip_cache: LRUCache[tuple[object, ...], Strip] = LRUCache(
+            _MIN_CACHE_SIZE
+        )
+        # Base strips with the cursor/selection/comment overlay, cropped to view
+        self._line_cache: LRUCache[tuple[object, ...], Strip] = LRUCache(
+            _MIN_CACHE_SIZE
+        )
         # Search state
         self._search_term: str = ""
         self._search_matches: list[tuple[int, int]] = []  # (line_idx, col)
+        self._search_lines: set[int] = set()
         self._current_match: int = -1
 
     @property
@@ -129,14 +205,17 @@ class DiffView(ScrollView):
             return None
         return line_idx
 
+    def on_resize(self, event: Resize) -> None:
+        self._resize_caches()
+
     def on_mouse_down(self, event: MouseDown) -> None:
         """Start drag selection."""
         idx = self._y_to_line_idx(event.y)
         if idx is not None:
+            self._refresh_selection()
+            self._selection_anchor = None
+            self._set_cursor(idx)
             self._selection_anchor = idx
-            self._cursor_pos = idx
-            self._line_cache.clear()
-            self.refresh()
             self.capture_mouse()
 
     def on_mouse_move(self, event: MouseMove) -> None:
@@ -146,14 +225,24 @@ class DiffView(ScrollView):
         if not event.button:
             return
         idx = self._y_to_line_idx(event.y)
-        if idx is not None and idx != self._cursor_pos:
-            self._cursor_pos = idx
-            self._line_cache.clear()
-            self.refresh()
+        if idx is not None:
+            self._drag_cursor = idx
+            if self._drag_timer is None:
+                self._drag_timer = self.set_timer(_DRAG_INTERVAL, self._flush_drag)
 
     def on_mouse_up(self, event: MouseUp) -> None:
         """End drag selection."""
         self.release_mouse()
+        if self._drag_timer is not None:
+            self._drag_timer.stop()
+        self._flush_drag()
+
+    def _flush_drag(self) -> None:
+        """Apply the latest drag position, coalescing moves within a frame."""
+        self._drag_timer = None
+        idx, self._drag_cursor = self._drag_cursor, None
+        if idx is not None and idx != self._cursor_pos:
+            self._set_cursor(idx)
 
     @property
     def has_search(self) -> bool:
@@ -163,41 +252,86 @@ class DiffView(ScrollView):
     def load_file(self, diff_file: DiffFile) -> None:
         """Load a new file's diff into the view."""
         self._diff_file = diff_file
+        self._parsed_code = [None] * len(diff_file.lines)
+        self._line_chrome = [None] * len(diff_file.lines)
+        self._line_segments = [None] * len(diff_file.lines)
+        self._hunk_indices = [
+            i for i, line in enumerate(diff_file.lines) if line.kind == "hunk_header"
+        ]
         self._cursor_pos = 0
         self._selection_anchor = None
         self._clear_search()
+        self._recompute_commented_lines()
         self._invalidate()
         self.scroll_to(0, 0, animate=False)
 
     def set_comments(self, comments: list[ReviewComment]) -> None:
-        """Update comments and re-render."""
+        """Update comments, repainting only the lines whose marker changed."""
+        old_ids = {id(c) for c in self._file_comments}
+        new_ids = {id(c) for c in comments}
+        changed = [c for c in self._file_comments if id(c) not in new_ids]
+        changed += [c for c in comments if id(c) not in old_ids]
         self._file_comments = comments
+        if not changed:
+            return
         self._recompute_commented_lines()
-        self._invalidate()
+        for c in changed:
+            self.refresh_lines(c.start_line, c.end_line - c.start_line + 1)
 
     def clear(self) -> None:
         """Clear the diff view."""
         self._diff_file = None
+        self._parsed_code = []
+        self._line_chrome = []
+        self._line_segments = []
+        self._hunk_indices = []
+        self._comment_starts = []
+        self._comment_ends = []
         self._invalidate()
 
     def _invalidate(self) -> None:
         """Recompute virtual size and trigger re-render."""
+        self._resize_caches()
+        self._base_strip_cache.clear()
         self._line_cache.clear()
-        self._recompute_commented_lines()
         count = self._line_count()
         width = self.size.width if self.size.width else 120
         self.virtual_size = Size(width, count)
         self.refresh()
 
+    def _resize_caches(self) -> None:
+        """Size the line caches to a few screens' worth of rows."""
+        height = self.scrollable_content_region.height
+        size = max(_MIN_CACHE_SIZE, _CACHE_SCREENS * height)
+        if size != self._line_cache.maxsize:
+            # LRUCache can't shrink in place, so start fresh
+            self._line_cache = LRUCache(size)
+            self._base_strip_cache = LRUCache(size)
+
     def _recompute_commented_lines(self) -> None:
-        """Cache the set of line indices that have comments."""
-        lines: set[int] = set()
+        """Merge the loaded file's comment ranges into disjoint intervals."""
+        starts: list[int] = []
+        ends: list[int] = []
         if self._diff_file:
-            for c in self._file_comments:
-                if c.file == self._diff_file.path:
-                    for i in range(c.start_line, c.end_line + 1):
-                        lines.add(i)
-        self._commented_lines = lines
+            path = self._diff_file.path
+            ranges = sorted(
+                (c.start_line, c.end_line)
+                for c in self._file_comments
+                if c.file == path
+            )
+            for start, end in ranges:
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+        self._comment_starts = starts
+        self._comment_ends = ends
+
+    def _is_commented(self, idx: int) -> bool:
+        """Return True if a comment covers line ``idx``."""
+        i = bisect_right(self._comment_starts, idx) - 1
+        return i >= 0 and idx <= self._comment_ends[i]
 
     def _line_count(self) -> int:
         if not self._diff_file:
@@ -214,107 +348,162 @@ class DiffView(ScrollView):
         if not self._diff_file or line_idx >= len(self._diff_file.lines):
             return Strip.blank(width, self.rich_style)
 
+        # Key on this line's own state so cursor and selection moves only
+        # miss for the rows they actually change.
+        is_cursor = self._cursor_pos == line_idx
         sel = self.selection_range
+        is_selected = sel is not None and sel[0] <= line_idx <= sel[1]
+        is_commented = self._is_commented(line_idx)
+        search_key = self._line_search_key(line_idx)
         cache_key = (
             line_idx,
             scroll_x,
             width,
-            self._cursor_pos == line_idx,
-            sel,
-            line_idx in self._commented_lines,
-            self._search_term,
-            self._current_match,
+            is_cursor,
+            is_selected,
+            is_commented,
+            search_key,
         )
-        if cache_key in self._line_cache:
-            return self._line_cache[cache_key]
+        strip = self._line_cache.get(cache_key)
+        if strip is not None:
+            return strip
 
         line = self._diff_file.lines[line_idx]
-        text = self._build_line(line_idx, line, sel, self._commented_lines)
-
-        # Convert Rich Text to Strip
-        segments = list(text.render(self.app.console))
-        strip = Strip(segments)
-        # Pad to full width and crop for horizontal scroll
-        strip = strip.extend_cell_length(width, self.rich_style)
-        strip = strip.crop(scroll_x, scroll_x + width)
+        strip = self._base_strip(line_idx, line, width, is_commented, search_key)
+        overlay = self._overlay_style(line, is_cursor, is_selected, is_commented)
+        if overlay is not None:
+            strip = strip.apply_style(overlay)
+        # Base strips are padded to width, so only long lines or a
+        # horizontal scroll need cropping.
+        if scroll_x or strip.cell_length > width:
+            strip = strip.crop(scroll_x, scroll_x + width)
 
         self._line_cache[cache_key] = strip
         return strip
 
+    def _line_search_key(self, idx: int) -> tuple[str, int] | None:
+        """Return the search state affecting line ``idx``, or None."""
+        if idx not in self._search_lines:
+            return None
+        current_col = -1
+        if 0 <= self._current_match < len(self._search_matches):
+            match_line, match_col = self._search_matches[self._current_match]
+            if match_line == idx:
+                current_col = match_col
+        return (self._search_term, current_col)
+
+    def _base_strip(
+        self,
+        idx: int,
+        line: DiffLine,
+        width: int,
+        commented: bool,
+        search_key: tuple[str, int] | None,
+    ) -> Strip:
+        """Return the line's content strip without any background overlay."""
+        key = (idx, width, commented, search_key)
+        strip = self._base_strip_cache.get(key)
+        if strip is None:
+            if search_key is None:
+                marker = _MARKER_SEGMENT if commented else _NO_MARKER_SEGMENT
+                strip = Strip([marker, *self._content_segments(idx, line)])
+            else:
+                # Search highlights restyle spans inside the code, so go
+                # through Text for this line.
+                text = self._build_line(idx, line, commented, search_key)
+                strip = Strip(list(text.render(self.app.console)))
+            strip = strip.extend_cell_length(width, self.rich_style)
+            self._base_strip_cache[key] = strip
+        return strip
+
+    def _content_segments(self, idx: int, line: DiffLine) -> list[Segment]:
+        """Return line ``idx``'s rendered chrome and code, after the marker."""
+        segments = self._line_segments[idx]
+        if segments is None:
+            text = Text()
+            text.append_text(self._chrome_text(idx, line))
+            if line.kind != "hunk_header":
+                text.append_text(self._code_text(idx, line))
+            segments = list(text.render(self.app.console))
+            self._line_segments[idx] = segments
+        return segments
+
+    def _code_text(self, idx: int, line: DiffLine) -> Text:
+        """Return the parsed highlighted code for line ``idx``."""
+        code = self._parsed_code[idx]
+        if code is None:
+            code = self._parsed_code[idx] = _parse_ansi(line.highlighted)
+        return code
+
+    def _chrome_text(self, idx: int, line: DiffLine) -> Text:
+        """Return line ``idx``'s gutter and prefix, or its styled hunk header."""
+        chrome = self._line_chrome[idx]
+        if chrome is None:
+            if line.kind == "hunk_header":
+                chrome = Text(line.plain_text, style=_HUNK_STYLE)
+            else:
+                chrome = Text(line.gutter, style=_GUTTER_STYLE)
+                chrome.append(line.prefix, style=_PREFIX_STYLES.get(line.kind))
+            self._line_chrome[idx] = chrome
+        return chrome
+
     def _build_line(
         self,
         idx: int,
         line: DiffLine,
-        sel_range: tuple[int, int] | None,
-        commented_lines: set[int],
+        commented: bool,
+        search_key: tuple[str, int] | None,
     ) -> Text:
         """Build a Rich Text for a single diff line."""
         text = Text()
 
         # Comment marker
-        if idx in commented_lines:
-            text.append("\u25cf ", style="yellow")
+        if commented:
+            text.append("\u25cf ", style=_MARKER_STYLE)
         else:
             text.append("  ")
 
-        # Hunk header — styled differently, no gutter
+        # Hunk header (no gutter), or gutter + prefix + highlighted code
+        text.append_text(self._chrome_text(idx, line))
         if line.kind == "hunk_header":
-            text.append(line.plain_text, style=_HUNK_STYLE)
-            bg = _BG_HUNK
+            offset = _MARKER_WIDTH
         else:
-            # Gutter: line numbers
-            old_no = f"{line.old_line_no:>4}" if line.old_line_no else "    "
-            new_no = f"{line.new_line_no:>4}" if line.new_line_no else "    "
-            text.append(f"{old_no} {new_no} ", style=_GUTTER_STYLE)
-
-            # Prefix (+/-/space)
-            if line.kind == "added":
-                text.append("+", style=_PREFIX_ADDED)
-            elif line.kind == "removed":
-                text.append("-", style=_PREFIX_REMOVED)
-            else:
-                text.append(" ")
-
-            # Syntax-highlighted code
-            text.append_text(Text.from_ansi(line.highlighted))
-
-            bg = None
-            if line.kind == "added":
-                bg = _BG_ADDED
-            elif line.kind == "removed":
-                bg = _BG_REMOVED
-
-        # Search match highlighting
-        if self._search_term:
-            plain = text.plain
-            try:
-                pat = re.escape(self._search_term)
-                for m in re.finditer(pat, plain, re.IGNORECASE):
-                    is_current = 0 <= self._current_match < len(
-                        self._search_matches
-                    ) and self._search_matches[self._current_match] == (idx, m.start())
-                    style = _SEARCH_CURRENT if is_current else _SEARCH_HIGHLIGHT
-                    text.stylize(style, m.start(), m.end())
-            except re.error:
-                pass
-
-        # Selection overrides
-        if sel_range and sel_range[0] <= idx <= sel_range[1]:
-            bg = _BG_SELECTION
-
-        # Comment background (unless selected)
-        if idx in commented_lines and bg != _BG_SELECTION:
-            bg = _BG_COMMENT
-
-        # Cursor line highlight
-        if idx == self._cursor_pos:
-            bg = bg or _BG_CURSOR
-            text.stylize(f"on {bg} bold underline")
-        elif bg:
-            text.stylize(f"on {bg}")
+            text.append_text(self._code_text(idx, line))
+            offset = _CODE_OFFSET
+
+        # Search match highlighting — columns are relative to plain_text,
+        # matching the positions recorded in _search_matches.
+        if search_key is not None:
+            term, current_col = search_key
+            for m in re.finditer(re.escape(term), line.plain_text, re.IGNORECASE):
+                style = (
+                    _SEARCH_CURRENT if m.start() == current_col else _SEARCH_HIGHLIGHT
+                )
+                text.stylize(style, offset + m.start(), offset + m.end())
 
         return text
 
+    def _overlay_style(
+        self,
+        line: DiffLine,
+        is_cursor: bool,
+        is_selected: bool,
+        is_commented: bool,
+    ) -> Style | None:
+        """Return the background/cursor style layered over the base strip."""
+        if is_selected:
+            bg: str | None = _BG_SELECTION
+        elif is_commented:
+            bg = _BG_COMMENT
+        else:
+            bg = _KIND_BG[line.kind]
+
+        if is_cursor:
+            return _CURSOR_STYLES[bg or _BG_CURSOR]
+        if bg:
+            return _BG_STYLES[bg]
+        return None
+
     # -- Cursor movement --
 
     def _move_cursor(self, delta: int) -> None:
@@ -324,11 +513,35 @@ class DiffView(ScrollView):
         new_pos = max(0, min(count - 1, self._cursor_pos + delta))
         if new_pos == self._cursor_pos:
             return
-        self._cursor_pos = new_pos
-        self._line_cache.clear()
-        self.refresh()
+        self._set_cursor(new_pos)
+        self._scroll_to_cursor()
+
+    def jump_to(self, idx: int) -> None:
+        """Move the cursor to line ``idx`` and scroll it into view."""
+        count = self._line_count()
+        if count == 0:
+            return
+        self._set_cursor(max(0, min(count - 1, idx)))
         self._scroll_to_cursor()
 
+    def _set_cursor(self, pos: int) -> None:
+        """Move the cursor, repainting only the rows whose styling changed."""
+        old_pos = self._cursor_pos
+        self._cursor_pos = pos
+        if self._selection_anchor is None:
+            self.refresh_line(old_pos)
+            self.refresh_line(pos)
+        else:
+            # The selection grows or shrinks by every row between the two.
+            lo, hi = min(old_pos, pos), max(old_pos, pos)
+            self.refresh_lines(lo, hi - lo + 1)
+
+    def _refresh_selection(self) -> None:
+        """Repaint the rows covered by the current selection, if any."""
+        sel = self.selection_range
+        if sel is not None:
+            self.refresh_lines(sel[0], sel[1] - sel[0] + 1)
+
     def _scroll_to_cursor(self) -> None:
         """Scroll only if cursor is outside the visible viewport."""
         margin = 3
@@ -354,17 +567,13 @@ class DiffView(ScrollView):
         self._move_cursor(-1)
 
     def action_cursor_top(self) -> None:
-        self._cursor_pos = 0
-        self._line_cache.clear()
-        self.refresh()
+        self._set_cursor(0)
         self.scroll_to(y=0, animate=False)
 
     def action_cursor_bottom(self) -> None:
         count = self._line_count()
         if count > 0:
-            self._cursor_pos = count - 1
-            self._line_cache.clear()
-            self.refresh()
+            self._set_cursor(count - 1)
             self._scroll_to_cursor()
 
     def action_page_down(self) -> None:
@@ -374,41 +583,28 @@ class DiffView(ScrollView):
         self._move_cursor(-(self.scrollable_content_region.height // 2))
 
     def action_next_hunk(self) -> None:
-        if not self._diff_file:
-            return
-        for i in range(self._cursor_pos + 1, len(self._diff_file.lines)):
-            if self._diff_file.lines[i].kind == "hunk_header":
-                self._cursor_pos = i
-                self._line_cache.clear()
-                self.refresh()
-                self._scroll_to_cursor()
-                return
+        i = bisect_right(self._hunk_indices, self._cursor_pos)
+        if i < len(self._hunk_indices):
+            self.jump_to(self._hunk_indices[i])
 
     def action_prev_hunk(self) -> None:
-        if not self._diff_file:
-            return
-        for i in range(self._cursor_pos - 1, -1, -1):
-            if self._diff_file.lines[i].kind == "hunk_header":
-                self._cursor_pos = i
-                self._line_cache.clear()
-                self.refresh()
-                self._scroll_to_cursor()
-                return
+        i = bisect_left(self._hunk_indices, self._cursor_pos)
+        if i > 0:
+            self.jump_to(self._hunk_indices[i - 1])
 
     # -- Selection --
 
     def action_toggle_selection(self) -> None:
         if self._selection_anchor is None:
             self._selection_anchor = self._cursor_pos
+            self.refresh_line(self._cursor_pos)
         else:
+            self._refresh_selection()
             self._selection_anchor = None
-        self._line_cache.clear()
-        self.refresh()
 
     def action_cancel_selection(self) -> None:
+        self._refresh_selection()
         self._selection_anchor = None
-        self._line_cache.clear()
-        self.refresh()
 
     # -- Comment actions --
 
@@ -440,6 +636,7 @@ class DiffView(ScrollView):
                 diff_content=diff_content,
             )
         )
+        self._refresh_selection()
         self._selection_anchor = None
 
     def action_next_comment(self) -> None:
@@ -466,6 +663,7 @@ class DiffView(ScrollView):
         """Set search term, find all matches, jump to first match after cursor."""
         self._search_term = term
         self._search_matches = []
+        self._search_lines = set()
         self._current_match = -1
 
         if not term or not self._diff_file:
@@ -477,6 +675,7 @@ class DiffView(ScrollView):
             # Search in the plain_text content of each line
             for m in re.finditer(pattern, line.plain_text, re.IGNORECASE):
                 self._search_matches.append((i, m.start()))
+        self._search_lines = {line_idx for line_idx, _col in self._search_matches}
 
         if self._search_matches:
             # Jump to first match at or after cursor
@@ -490,7 +689,6 @@ class DiffView(ScrollView):
                 self._current_match = 0
                 self._cursor_pos = self._search_matches[0][0]
 
-        self._line_cache.clear()
         self.refresh()
         self._scroll_to_cursor()
 
@@ -498,32 +696,30 @@ class DiffView(ScrollView):
         """Jump to the next search match."""
         if not self._search_matches:
             return
+        self.refresh_line(self._search_matches[self._current_match][0])
         self._current_match = (self._current_match + 1) % len(self._search_matches)
-        self._cursor_pos = self._search_matches[self._current_match][0]
-        self._line_cache.clear()
-        self.refresh()
+        self._set_cursor(self._search_matches[self._current_match][0])
         self._scroll_to_cursor()
 
     def prev_match(self) -> None:
         """Jump to the previous search match."""
         if not self._search_matches:
             return
+        self.refresh_line(self._search_matches[self._current_match][0])
         self._current_match = (self._current_match - 1) % len(self._search_matches)
-        self._cursor_pos = self._search_matches[self._current_match][0]
-        self._line_cache.clear()
-        self.refresh()
+        self._set_cursor(self._search_matches[self._current_match][0])
         self._scroll_to_cursor()
 
     def _clear_search(self) -> None:
         """Clear search state without re-rendering."""
         self._search_term = ""
         self._search_matches = []
+        self._search_lines = set()
         self._current_match = -1
 
     def clear_search(self) -> None:
         """Clear search and re-render."""
         self._clear_search()
-        self._line_cache.clear()
         self.refresh()
 
     @property
@@ -1,15 +1,38 @@
 from __future__ import annotations
 
+import fcntl
 import os
 import re
+import shlex
 import shutil
+import stat
+import string
 import subprocess
 import tomllib
+from collections import ChainMap
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# ASCII translation for sanitize_branch_name: "/" becomes "-", and anything
+# other than letters, digits, "_", "-" and "." is dropped
+_BRANCH_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-.")
+_SANITIZE_TABLE: dict[int, str | None] = {
+    i: None for i in range(128) if chr(i) not in _BRANCH_NAME_CHARS
+}
+_SANITIZE_TABLE[ord("/")] = "-"
+# Fallback for non-ASCII names, where \w also admits Unicode word characters
+_SANITIZE_RE = re.compile(r"[^\w\-.]")
+
+# Upper bound on concurrent copies for .womtrees.toml [copy] entries
+_COPY_WORKERS = 8
+# Linux ioctl that clones a file's extents (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
 
 @dataclass
 class ScriptResult:
@@ -21,8 +44,10 @@ class ScriptResult:
 
 def sanitize_branch_name(branch: str) -> str:
     """Sanitize a branch name for use as a directory name."""
-    name = branch.replace("/", "-")
-    name = re.sub(r"[^\w\-.]", "", name)
+    if branch.isascii():
+        name = branch.translate(_SANITIZE_TABLE)
+    else:
+        name = _SANITIZE_RE.sub("", branch.replace("/", "-"))
     name = name.strip("-.")
     return name or "worktree"
 
@@ -31,107 +56,200 @@ def get_current_repo() -> tuple[str, str] | None:
     """Return (repo_name, repo_path) if cwd is inside a git repo.
 
     When inside a worktree, resolves to the main repository (not the worktree).
+    Repos found are memoized per working directory for the life of the
+    process; a directory outside any repo is checked again on the next call.
     """
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-common-dir"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        git_common_dir = Path(result.stdout.strip())
-        if not git_common_dir.is_absolute():
-            # In a normal (non-worktree) repo, git returns relative ".git"
-            git_common_dir = (Path.cwd() / git_common_dir).resolve()
-        # --git-common-dir returns the .git dir (e.g. /path/to/repo/.git)
-        # The repo root is its parent.
-        repo_path = str(git_common_dir.parent)
-        repo_name = git_common_dir.parent.name
-        return repo_name, repo_path
+        return _repo_for_cwd(os.path.realpath(os.getcwd()))
     except (subprocess.CalledProcessError, FileNotFoundError):
         return None
 
 
-def load_womtrees_config(repo_path: str) -> dict[str, Any] | None:
+@lru_cache(maxsize=32)
+def _repo_for_cwd(cwd: str) -> tuple[str, str]:
+    """Resolve the main repository containing ``cwd``.
+
+    Raises if ``cwd`` is not inside a repo, so lru_cache never stores misses.
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-common-dir"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    git_common_dir = Path(result.stdout.strip())
+    if not git_common_dir.is_absolute():
+        # In a normal (non-worktree) repo, git returns relative ".git"
+        git_common_dir = (Path(cwd) / git_common_dir).resolve()
+    # --git-common-dir returns the .git dir (e.g. /path/to/repo/.git)
+    # The repo root is its parent.
+    repo_path = str(git_common_dir.parent)
+    repo_name = git_common_dir.parent.name
+    return repo_name, repo_path
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for ``path``, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_womtrees_config(repo_path: str) -> Mapping[str, Any] | None:
     """Load .womtrees.toml from a repo root, with .womtrees.local.toml overrides.
 
     Returns None if no config file exists. Local overrides replace base keys
     at the section level (e.g. local [scripts] fully replaces base [scripts]).
+
+    Each file is parsed once per version (mtime and size) and the two are
+    layered with a ChainMap rather than merged, so the result is a shared,
+    read-only view.
     """
-    base_path = Path(repo_path) / ".womtrees.toml"
-    local_path = Path(repo_path) / ".womtrees.local.toml"
+    root = Path(repo_path)
+    base_key = _stat_key(root / ".womtrees.toml")
+    local_key = _stat_key(root / ".womtrees.local.toml")
 
-    if not base_path.exists() and not local_path.exists():
+    if base_key is None and local_key is None:
         return None
 
-    config: dict[str, Any] = {}
+    return _load_womtrees_config(repo_path, base_key, local_key)
 
-    if base_path.exists():
-        with open(base_path, "rb") as f:
-            config = tomllib.load(f)
 
-    if local_path.exists():
-        with open(local_path, "rb") as f:
-            local = tomllib.load(f)
-        # Key-level override: local sections replace base sections entirely
-        for key, value in local.items():
-            config[key] = value
+@lru_cache(maxsize=64)
+def _load_womtrees_config(
+    repo_path: str,
+    base_key: tuple[int, int] | None,
+    local_key: tuple[int, int] | None,
+) -> ChainMap[str, Any]:
+    """Layer the parsed files, local first so its sections win."""
+    layers: list[dict[str, Any]] = []
+    if local_key is not None:
+        layers.append(
+            _load_toml(os.path.join(repo_path, ".womtrees.local.toml"), local_key)
+        )
+    if base_key is not None:
+        layers.append(_load_toml(os.path.join(repo_path, ".womtrees.toml"), base_key))
+    return ChainMap(*layers)
+
 
-    return config
+@lru_cache(maxsize=64)
+def _load_toml(path: str, stat_key: tuple[int, int]) -> dict[str, Any]:
+    """Parse one TOML file; ``stat_key`` only keys the cache."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
 
 
 def create_worktree(repo_path: str, branch: str, base_dir: Path) -> Path:
     """Create a git worktree and run setup from .womtrees.toml if present.
 
+    [copy] entries are copied before [scripts] setup runs, unless
+    ``setup_parallel = true`` in [scripts] says setup doesn't need the copied
+    files, in which case the two run concurrently. Setup must then not read
+    any copied file: there is no ordering between the two.
+
     Returns the worktree path.
     Raises SetupScriptError if setup scripts fail (worktree is rolled back).
+    With ``setup_parallel``, an error from either the copy or the scripts
+    also rolls the worktree back before it is re-raised.
     """
     repo_name = Path(repo_path).name
     sanitized = sanitize_branch_name(branch)
     worktree_path = base_dir / repo_name / sanitized
 
-    worktree_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Check if branch exists
-    result = subprocess.run(
-        ["git", "-C", repo_path, "rev-parse", "--verify", branch],
-        capture_output=True,
-        text=True,
-    )
-    branch_exists = result.returncode == 0
+    # Read .womtrees.toml up front so a bad [copy] mode fails before git
+    # creates anything
+    config = load_womtrees_config(repo_path)
+    if config:
+        _copy_function(config)
 
-    cmd = ["git", "-C", repo_path, "worktree", "add"]
-    if not branch_exists:
-        cmd += ["-b", branch, str(worktree_path)]
-    else:
-        cmd += [str(worktree_path), branch]
+    worktree_path.parent.mkdir(parents=True, exist_ok=True)
 
-    subprocess.run(cmd, check=True, capture_output=True, text=True)
+    # New branches are the common case, so try creating one first and only
+    # fall back to checking out the branch if it turns out to exist already.
+    add = ["git", "-C", repo_path, "worktree", "add"]
+    target = str(worktree_path)
+    try:
+        subprocess.run(
+            [*add, "-b", branch, target],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except subprocess.CalledProcessError:
+        exists = subprocess.run(
+            [
+                "git",
+                "-C",
+                repo_path,
+                "show-ref",
+                "--verify",
+                "--quiet",
+                f"refs/heads/{branch}",
+            ],
+        )
+        if exists.returncode != 0:
+            raise
+        subprocess.run(
+            [*add, target, branch],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
 
     # Run .womtrees.toml setup
-    config = load_womtrees_config(repo_path)
     if config:
-        _run_womtrees_copy(config, repo_path, worktree_path)
-        setup_cmds = config.get("scripts", {}).get("setup", [])
-        if setup_cmds:
-            script_result = _run_scripts(
-                setup_cmds,
-                worktree_path,
-                repo_path,
-                "setup",
-                branch,
-            )
-            if not script_result.success:
-                # Roll back: remove the worktree
-                try:
-                    _remove_worktree_git(worktree_path, repo_path)
-                except Exception:
-                    pass
-                raise SetupScriptError(script_result.log_path)
+        scripts = config.get("scripts", {})
+        setup_cmds = scripts.get("setup", [])
+        script_result: ScriptResult | None = None
+        if setup_cmds and scripts.get("setup_parallel", False):
+            # The config declares setup independent of [copy], so overlap them
+            try:
+                with ThreadPoolExecutor(max_workers=1) as ex:
+                    pending = ex.submit(
+                        _run_scripts,
+                        setup_cmds,
+                        worktree_path,
+                        repo_path,
+                        "setup",
+                        branch,
+                    )
+                    _run_womtrees_copy(config, repo_path, worktree_path)
+                    script_result = pending.result()
+            except Exception:
+                # Leaving the with block waited for the scripts, so nothing is
+                # still running in the half-populated worktree
+                _rollback_worktree(worktree_path, repo_path)
+                raise
+        else:
+            _run_womtrees_copy(config, repo_path, worktree_path)
+            if setup_cmds:
+                script_result = _run_scripts(
+                    setup_cmds,
+                    worktree_path,
+                    repo_path,
+                    "setup",
+                    branch,
+                )
+        if script_result is not None and not script_result.success:
+            _rollback_worktree(worktree_path, repo_path)
+            raise SetupScriptError(script_result.log_path)
 
     return worktree_path
 
 
+def _rollback_worktree(worktree_path: Path, repo_path: str) -> None:
+    """Remove a worktree whose setup failed, ignoring errors."""
+    try:
+        _remove_worktree_git(worktree_path, repo_path)
+    except Exception:
+        pass
+
+
 class SetupScriptError(Exception):
     """Raised when setup scripts fail during worktree creation."""
 
@@ -144,21 +262,126 @@ class SetupScriptError(Exception):
 
 
 def _run_womtrees_copy(
-    config: dict[str, Any],
+    config: Mapping[str, Any],
     repo_path: str,
     worktree_path: Path,
 ) -> None:
-    """Copy files from source repo to worktree based on config."""
+    """Copy files from source repo to worktree based on config.
+
+    Entries are independent, so several are copied at once to overlap I/O.
+    ``[copy] mode`` picks how files are copied: "copy" (default),
+    "reflink" (copy-on-write clone where the filesystem supports it) or
+    "link"/"hardlink" (hardlink, so edits show up in both trees). Both fall
+    back to a plain copy when the filesystem or device doesn't allow them.
+    """
     copy_files = config.get("copy", {}).get("files", [])
-    for file_path in copy_files:
-        src = Path(repo_path) / file_path
-        dst = worktree_path / file_path
-        if src.exists():
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            if src.is_dir():
-                shutil.copytree(src, dst, dirs_exist_ok=True)
-            else:
-                shutil.copy2(src, dst)
+    copy_function = _copy_function(config)
+    repo_root = Path(repo_path)
+    if len(copy_files) <= 1:
+        for file_path in copy_files:
+            _copy_one(repo_root, worktree_path, file_path, copy_function)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(copy_files))) as ex:
+        # Consume the results so the first failure is raised here
+        list(
+            ex.map(
+                lambda file_path: _copy_one(
+                    repo_root, worktree_path, file_path, copy_function
+                ),
+                copy_files,
+            )
+        )
+
+
+def _copy_one(
+    repo_root: Path,
+    worktree_path: Path,
+    file_path: str,
+    copy_function: Callable[[str, str], object],
+) -> None:
+    """Copy one configured file or directory into the worktree, if present."""
+    src = repo_root / file_path
+    dst = worktree_path / file_path
+    try:
+        st = src.stat()
+    except FileNotFoundError:
+        return
+    if dst.parent != worktree_path:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+    if stat.S_ISDIR(st.st_mode):
+        shutil.copytree(src, dst, copy_function=copy_function, dirs_exist_ok=True)
+    else:
+        copy_function(str(src), str(dst))
+
+
+def _reflink_or_copy(src: str, dst: str) -> str:
+    """Clone ``src`` to ``dst`` with FICLONE, falling back to copy2."""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink ``src`` to ``dst``, falling back to copy2."""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        # Already linked by an earlier copy into this tree
+        if not os.path.samefile(src, dst):
+            return shutil.copy2(src, dst)
+    except OSError:
+        return shutil.copy2(src, dst)
+    return dst
+
+
+_COPY_FUNCTIONS: dict[str, Callable[[str, str], object]] = {
+    "copy": shutil.copy2,
+    "reflink": _reflink_or_copy,
+    "link": _link_or_copy,
+    "hardlink": _link_or_copy,
+}
+
+
+def _copy_function(config: Mapping[str, Any]) -> Callable[[str, str], object]:
+    """Return the copy function for ``[copy] mode``.
+
+    Raises ValueError for an unknown mode rather than quietly doing a full
+    copy.
+    """
+    mode = config.get("copy", {}).get("mode", "copy")
+    try:
+        return _COPY_FUNCTIONS[mode]
+    except (KeyError, TypeError):
+        modes = ", ".join(sorted(_COPY_FUNCTIONS))
+        raise ValueError(
+            f"Unknown [copy] mode {mode!r} in .womtrees.toml (expected one of: {modes})"
+        ) from None
+
+
+def _batch_script(commands: list[str]) -> str:
+    """Build one sh script that runs ``commands`` in order, logging each.
+
+    Each command is eval'd in its own subshell, so like separate ``sh -c``
+    runs it can't leak cd/exports into the next one, and a syntax error
+    only fails that command. The script stops at the first failure.
+    """
+    lines: list[str] = []
+    for i, cmd in enumerate(commands):
+        lines += [
+            f"printf '%s\\n' {shlex.quote(f'$ {cmd}')}",
+            f"(eval {shlex.quote(cmd)})",
+            "rc=$?",
+            "printf 'exit: %s\\n\\n' \"$rc\"",
+            f'if [ "$rc" -ne 0 ]; then echo "RESULT: FAILED at command {i + 1}"; '
+            'exit "$rc"; fi',
+        ]
+    lines.append('echo "RESULT: SUCCESS"')
+    return "\n".join(lines) + "\n"
 
 
 def _run_scripts(
@@ -170,43 +393,33 @@ def _run_scripts(
 ) -> ScriptResult:
     """Run shell commands sequentially with logging.
 
-    Writes output to /tmp/womtrees-<action>-<branch>-<timestamp>.log.
+    All commands run from a single shell (see _batch_script) whose output
+    goes to /tmp/womtrees-<action>-<branch>-<timestamp>.log.
     On success, the log is deleted. On failure, the log is preserved.
     """
     sanitized = sanitize_branch_name(branch)
     timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
     log_path = Path(f"/tmp/womtrees-{action}-{sanitized}-{timestamp}.log")
 
-    env = os.environ.copy()
-    env["ROOT_WORKTREE_PATH"] = repo_path
+    env = {**os.environ, "ROOT_WORKTREE_PATH": repo_path}
 
     with open(log_path, "w") as log:
         log.write(f"[womtrees {action}] {datetime.now(tz=timezone.utc).isoformat()}\n")
         log.write(f"worktree: {worktree_path}\n")
         log.write(f"repo: {repo_path}\n\n")
+        # The shell writes to the same file descriptor after this
+        log.flush()
 
-        for i, cmd in enumerate(commands):
-            log.write(f"$ {cmd}\n")
-            log.flush()
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                cwd=worktree_path,
-                env=env,
-                capture_output=True,
-                text=True,
-            )
-            if result.stdout:
-                log.write(result.stdout)
-            if result.stderr:
-                log.write(result.stderr)
-            log.write(f"exit: {result.returncode}\n\n")
-
-            if result.returncode != 0:
-                log.write(f"RESULT: FAILED at command {i + 1}\n")
-                return ScriptResult(success=False, log_path=log_path)
+        result = subprocess.run(
+            ["/bin/sh", "-c", _batch_script(commands)],
+            cwd=worktree_path,
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
 
-        log.write("RESULT: SUCCESS\n")
+    if result.returncode != 0:
+        return ScriptResult(success=False, log_path=log_path)
 
     # Auto-cleanup on success
     log_path.unlink(missing_ok=True)
@@ -214,29 +427,85 @@ def _run_scripts(
 
 
 def get_default_branch(repo_path: str) -> str:
-    """Return the default branch name (main or master) for a repo."""
+    """Return the default branch name (main or master) for a repo.
+
+    Prefers the branch origin/HEAD points at, then a local main or master.
+    All three refs are read with a single for-each-ref call. The result is
+    memoized per repo, so relative or symlinked spellings of the same path
+    share an entry; call ``clear_repo_caches()`` if the default branch may
+    have changed.
+    """
+    return _default_branch(os.path.realpath(repo_path))
+
+
+def clear_repo_caches() -> None:
+    """Forget memoized repo lookups (current repo and default branches)."""
+    _repo_for_cwd.cache_clear()
+    _default_branch.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def _default_branch(repo_path: str) -> str:
+    branch = _default_branch_from_files(Path(repo_path) / ".git")
+    if branch is not None:
+        return branch
+
     result = subprocess.run(
-        ["git", "-C", repo_path, "symbolic-ref", "refs/remotes/origin/HEAD"],
+        [
+            "git",
+            "-C",
+            repo_path,
+            "for-each-ref",
+            "--format=%(refname) %(symref)",
+            "refs/remotes/origin/HEAD",
+            "refs/heads/main",
+            "refs/heads/master",
+        ],
         capture_output=True,
         text=True,
     )
-    if result.returncode == 0:
+    refs: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        name, _, target = line.partition(" ")
+        refs[name] = target
+
+    origin_head = refs.get("refs/remotes/origin/HEAD")
+    if origin_head:
         # refs/remotes/origin/main -> main
-        return result.stdout.strip().rsplit("/", 1)[-1]
+        return origin_head.rsplit("/", 1)[-1]
 
     # Fallback: check if main or master exists
     for branch in ("main", "master"):
-        result = subprocess.run(
-            ["git", "-C", repo_path, "rev-parse", "--verify", branch],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
+        if f"refs/heads/{branch}" in refs:
             return branch
 
     return "main"
 
 
+def _default_branch_from_files(git_dir: Path) -> str | None:
+    """Answer get_default_branch from loose ref files, without running git.
+
+    Returns None when the files can't settle it (no origin/HEAD and no loose
+    main, a reftable repo, or ``git_dir`` not being a plain .git directory), so
+    the caller falls back to asking git.
+    """
+    if not git_dir.is_dir() or (git_dir / "reftable").exists():
+        return None
+    try:
+        # Symbolic refs are never packed, so a missing file means no origin/HEAD
+        origin_head = (git_dir / "refs" / "remotes" / "origin" / "HEAD").read_text()
+    except OSError:
+        origin_head = ""
+    if origin_head.startswith("ref:"):
+        # ref: refs/remotes/origin/main -> main
+        return origin_head.strip().rsplit("/", 1)[-1]
+    # main wins over master, so only a loose main settles it; a loose master
+    # could still lose to a main that lives in packed-refs.
+    if (git_dir / "refs" / "heads" / "main").is_file():
+        return "main"
+    return None
+
+
 class RebaseRequiredError(Exception):
     """Raised when a branch needs rebasing before it can be merged."""
 
@@ -258,8 +527,8 @@ def needs_rebase(repo_path: str, branch: str) -> bool:
     # If it is NOT an ancestor, the feature branch is behind and needs rebase.
     result = subprocess.run(
         ["git", "-C", repo_path, "merge-base", "--is-ancestor", default_branch, branch],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     return result.returncode != 0
 
@@ -289,8 +558,8 @@ def abort_rebase(worktree_path: str) -> None:
     subprocess.run(
         ["git", "rebase", "--abort"],
         cwd=worktree_path,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
 
@@ -327,26 +596,27 @@ def get_diff_stats(repo_path: str, branch: str) -> tuple[int, int]:
         capture_output=True,
         text=True,
     )
-    if result.returncode != 0 or not result.stdout.strip():
+    if result.returncode != 0:
         return (0, 0)
-
-    text = result.stdout.strip()
-    insertions = 0
-    deletions = 0
-    # Parse "N files changed, X insertions(+), Y deletions(-)"
-    match = re.search(r"(\d+) insertion", text)
-    if match:
-        insertions = int(match.group(1))
-    match = re.search(r"(\d+) deletion", text)
-    if match:
-        deletions = int(match.group(1))
-    return (insertions, deletions)
+    return _parse_shortstat(result.stdout)
 
 
 def has_uncommitted_changes(worktree_path: str) -> bool:
-    """Check if a worktree has uncommitted changes (dirty working tree)."""
+    """Check if a worktree has uncommitted changes (dirty working tree).
+
+    Untracked (non-ignored) files count as changes. A single
+    ``git status --porcelain`` call covers both tracked and untracked
+    files.
+    """
     result = subprocess.run(
-        ["git", "-C", worktree_path, "status", "--porcelain"],
+        [
+            "git",
+            "-C",
+            worktree_path,
+            "status",
+            "--porcelain",
+            "--untracked-files=normal",
+        ],
         capture_output=True,
         text=True,
     )
@@ -360,18 +630,25 @@ def get_uncommitted_diff_stats(worktree_path: str) -> tuple[int, int]:
         capture_output=True,
         text=True,
     )
-    if result.returncode != 0 or not result.stdout.strip():
+    if result.returncode != 0:
         return (0, 0)
+    return _parse_shortstat(result.stdout)
+
 
-    text = result.stdout.strip()
+def _parse_shortstat(text: str) -> tuple[int, int]:
+    """Parse "N files changed, X insertions(+), Y deletions(-)".
+
+    Either count is omitted by git when it is zero; empty output means no
+    changes at all.
+    """
     insertions = 0
     deletions = 0
-    match = re.search(r"(\d+) insertion", text)
-    if match:
-        insertions = int(match.group(1))
-    match = re.search(r"(\d+) deletion", text)
-    if match:
-        deletions = int(match.group(1))
+    for part in text.split(","):
+        count, _, label = part.strip().partition(" ")
+        if label.startswith("insertion"):
+            insertions = int(count)
+        elif label.startswith("deletion"):
+            deletions = int(count)
     return (insertions, deletions)
 
 
@@ -391,7 +668,8 @@ def merge_branch(repo_path: str, branch: str) -> str:
     subprocess.run(
         ["git", "-C", repo_path, "checkout", default_branch],
         check=True,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
     )
 
@@ -411,20 +689,41 @@ def rename_branch(worktree_path: str, old_branch: str, new_branch: str) -> None:
     subprocess.run(
         ["git", "-C", worktree_path, "branch", "-m", old_branch, new_branch],
         check=True,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
     )
 
 
 def _discover_repo_path(worktree_path: Path) -> Path | None:
-    """Discover the main repo path from a worktree's .git file."""
+    """Discover the main repo path from a worktree's .git file.
+
+    The file is only read again when its mtime or size changes, so bulk
+    operations over many worktrees stat each one instead of reading it.
+    """
     git_file = worktree_path / ".git"
-    if git_file.is_file():
-        content = git_file.read_text().strip()
-        if content.startswith("gitdir:"):
-            git_dir = Path(content.split(":", 1)[1].strip())
-            # Go up from .git/worktrees/<name> to the repo root
-            return git_dir.parent.parent.parent
+    try:
+        st = git_file.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if stat.S_ISDIR(st.st_mode):
+        # A main checkout, not a linked worktree
+        return None
+    return _read_gitdir_file(str(git_file), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=128)
+def _read_gitdir_file(git_file: str, mtime_ns: int, size: int) -> Path | None:
+    """Resolve the repo root named by a ``gitdir:`` file (cached per version)."""
+    try:
+        with open(git_file, "rb") as f:
+            data = f.read()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    if data.startswith(b"gitdir:"):
+        git_dir = Path(os.fsdecode(data[7:].strip()))
+        # Go up from .git/worktrees/<name> to the repo root
+        return git_dir.parent.parent.parent
     return None
 
 
@@ -448,7 +747,8 @@ def remove_worktree(
     # Run teardown scripts before removal
     warning: str | None = None
     if repo_path:
-        config = load_womtrees_config(str(repo_path))
+        repo = str(repo_path)
+        config = load_womtrees_config(repo)
         if config:
             teardown_cmds = config.get("scripts", {}).get("teardown", [])
             if teardown_cmds:
@@ -458,7 +758,7 @@ def remove_worktree(
                 result = _run_scripts(
                     teardown_cmds,
                     worktree_path,
-                    str(repo_path),
+                    repo,
                     "teardown",
                     branch,
                 )
@@ -473,17 +773,16 @@ def _remove_worktree_git(
     worktree_path: Path,
     repo_path: str | Path | None = None,
 ) -> None:
-    """Low-level git worktree remove + prune."""
+    """Low-level git worktree remove.
+
+    ``worktree remove`` already deletes the worktree's administrative
+    entry, so no ``worktree prune`` is needed afterwards.
+    """
     cmd = ["git"]
     if repo_path:
         cmd += ["-C", str(repo_path)]
     cmd += ["worktree", "remove", str(worktree_path), "--force"]
 
-    subprocess.run(cmd, check=True, capture_output=True, text=True)
-
-    prune_cmd = ["git"]
-    if repo_path:
-        prune_cmd += ["-C", str(repo_path)]
-    prune_cmd += ["worktree", "prune"]
-
-    subprocess.run(prune_cmd, capture_output=True, text=True)
+    subprocess.run(
+        cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sqlite3
 from unittest.mock import patch
 
 import pytest
@@ -13,3 +14,16 @@ def _no_subprocess_generate_name():
         side_effect=lambda prompt: prompt[:40].lower().replace(" ", "-"),
     ):
         yield
+
+
+@pytest.fixture(scope="session")
+def _db_template(tmp_path_factory):
+    """Build a schema-initialized SQLite file once; db_conn fixtures copy it."""
+    from womtrees.db import _ensure_schema
+
+    db_path = tmp_path_factory.mktemp("db_template") / "test.db"
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    _ensure_schema(conn)
+    conn.close()
+    return db_path
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import subprocess
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
+from womtrees import tmux
 from womtrees.cli import cli
+from womtrees.cli.items import start
 from womtrees.config import LayoutConfig, PaneConfig, WindowConfig
-from womtrees.db import _ensure_schema
+from womtrees.db import create_work_item
 
 STANDARD_LAYOUT = LayoutConfig(
     windows=[
@@ -32,28 +36,89 @@ STANDARD_LAYOUT_RIGHT = LayoutConfig(
 
 
 @pytest.fixture
+def make_todo(db_conn):
+    """Insert TODO items directly, for tests where `wt todo` is only setup."""
+    get_conn_fn, _name = db_conn
+
+    def _make(branch, prompt=None, name=None):
+        conn = get_conn_fn()
+        try:
+            return create_work_item(
+                conn, "myrepo", "/tmp/myrepo", branch, prompt, name=name
+            )
+        finally:
+            conn.close()
+
+    return _make
+
+
+def _call(command, **params):
+    """Run a command directly for setup steps whose output isn't checked.
+
+    Skips CliRunner's stdio redirection and argv parsing, and lets any
+    failure propagate instead of hiding it in a Result.
+    """
+    with click.Context(cli) as ctx:
+        ctx.invoke(command, **params)
+
+
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
 @pytest.fixture
-def db_conn(tmp_path):
-    """Provide an in-memory-like DB by patching get_connection."""
+def db_conn(_db_template):
+    """Provide a shared in-memory DB by patching get_connection.
+
+    A keeper connection holds the named in-memory database open for the
+    test, so every connection handed to the CLI sees the same data without
+    touching disk. The schema is copied in from the session template.
+    """
     import sqlite3
+    import uuid
 
-    db_path = tmp_path / "test.db"
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys=ON")
-    _ensure_schema(conn)
+    name = f"wt_{uuid.uuid4().hex}"
+    uri = f"file:{name}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(uri, uri=True)
+    template = sqlite3.connect(_db_template)
+    template.backup(keeper)
+    template.close()
 
     def _get_conn(db_path_arg=None):
-        c = sqlite3.connect(str(db_path))
+        c = sqlite3.connect(uri, uri=True)
         c.row_factory = sqlite3.Row
         c.execute("PRAGMA foreign_keys=ON")
         return c
 
-    return _get_conn, db_path
+    yield _get_conn, name
+    keeper.close()
+
+
+@pytest.fixture
+def cli_env(monkeypatch, db_conn):
+    """Point the CLI at the test DB and a fake current repo."""
+    monkeypatch.setattr("womtrees.db.get_connection", db_conn[0])
+    monkeypatch.setattr(
+        "womtrees.cli.utils.get_current_repo", lambda: ("myrepo", "/tmp/myrepo")
+    )
+
+
+@pytest.fixture
+def tmux_mock(monkeypatch):
+    """Replace the tmux module with a spec'd mock of a healthy tmux server.
+
+    Services import tmux lazily via ``from womtrees import tmux``, so
+    swapping the package attribute covers every call site at once.
+    """
+    mock = MagicMock(spec=tmux)
+    mock.sanitize_session_name.side_effect = tmux.sanitize_session_name
+    mock.is_available.return_value = True
+    mock.create_session.return_value = ("myrepo/feat-x", "%0")
+    mock.split_pane.return_value = "%1"
+    mock.session_exists.return_value = True
+    monkeypatch.setattr("womtrees.tmux", mock)
+    return mock
 
 
 def test_help(runner) -> None:
@@ -62,152 +127,86 @@ def test_help(runner) -> None:
     assert "womtrees" in result.output
 
 
-def test_todo_not_in_repo(runner, tmp_path, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch("womtrees.cli.utils.get_current_repo", return_value=None),
-    ):
-        result = runner.invoke(cli, ["todo", "test", "-b", "feat/x"])
-        assert result.exit_code != 0
-        assert "Not inside a git repository" in result.output
+def test_todo_not_in_repo(runner, tmp_path, cli_env, monkeypatch) -> None:
+    monkeypatch.setattr("womtrees.cli.utils.get_current_repo", lambda: None)
+    result = runner.invoke(cli, ["todo", "test", "-b", "feat/x"])
+    assert result.exit_code != 0
+    assert "Not inside a git repository" in result.output
 
 
-def test_todo_creates_item(runner, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        result = runner.invoke(cli, ["todo", "do stuff", "-b", "feat/x"])
-        assert result.exit_code == 0
-        assert "Created TODO #1" in result.output
+def test_todo_creates_item(runner, cli_env) -> None:
+    result = runner.invoke(cli, ["todo", "do stuff", "-b", "feat/x"])
+    assert result.exit_code == 0
+    assert "Created TODO #1" in result.output
 
 
-def test_list_empty(runner, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-    ):
-        result = runner.invoke(cli, ["list"])
-        assert result.exit_code == 0
-        assert "No work items found" in result.output
+def test_list_empty(runner, cli_env) -> None:
+    result = runner.invoke(cli, ["list"])
+    assert result.exit_code == 0
+    assert "No work items found" in result.output
 
 
-def test_list_shows_items(runner, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "first", "-b", "feat/a"])
-        runner.invoke(cli, ["todo", "second", "-b", "feat/b"])
+def test_list_shows_items(runner, cli_env, make_todo) -> None:
+    make_todo("feat/a", "first")
+    make_todo("feat/b", "second")
 
-        result = runner.invoke(cli, ["list"])
-        assert result.exit_code == 0
-        assert "feat/a" in result.output
-        assert "feat/b" in result.output
+    result = runner.invoke(cli, ["list"])
+    assert result.exit_code == 0
+    assert "feat/a" in result.output
+    assert "feat/b" in result.output
 
 
-def test_status_summary(runner, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/a"])
-        runner.invoke(cli, ["todo", "-b", "feat/b"])
+def test_status_summary(runner, cli_env, make_todo) -> None:
+    make_todo("feat/a")
+    make_todo("feat/b")
 
-        result = runner.invoke(cli, ["status"])
-        assert result.exit_code == 0
-        assert "todo: 2" in result.output
+    result = runner.invoke(cli, ["status"])
+    assert result.exit_code == 0
+    assert "todo: 2" in result.output
 
 
-def test_status_single(runner, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "my prompt", "-b", "feat/a"])
+def test_status_single(runner, cli_env, make_todo) -> None:
+    make_todo("feat/a", "my prompt")
 
-        result = runner.invoke(cli, ["status", "1"])
-        assert result.exit_code == 0
-        assert "feat/a" in result.output
-        assert "my prompt" in result.output
+    result = runner.invoke(cli, ["status", "1"])
+    assert result.exit_code == 0
+    assert "feat/a" in result.output
+    assert "my prompt" in result.output
 
 
-def test_review_transition(runner, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/a"])
+def test_review_transition(runner, cli_env, make_todo) -> None:
+    make_todo("feat/a")
 
-        # Can't review a TODO
-        result = runner.invoke(cli, ["review", "1"])
-        assert result.exit_code != 0
-        assert "expected 'working' or 'input'" in result.output
+    # Can't review a TODO
+    result = runner.invoke(cli, ["review", "1"])
+    assert result.exit_code != 0
+    assert "expected 'working' or 'input'" in result.output
 
 
-def test_done_transition(runner, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/a"])
+def test_done_transition(runner, cli_env, make_todo) -> None:
+    make_todo("feat/a")
 
-        # Can't mark TODO as done
-        result = runner.invoke(cli, ["done", "1"])
-        assert result.exit_code != 0
-        assert "expected 'working' or 'input' or 'review'" in result.output
+    # Can't mark TODO as done
+    result = runner.invoke(cli, ["done", "1"])
+    assert result.exit_code != 0
+    assert "expected 'working' or 'input' or 'review'" in result.output
 
 
-def test_delete_todo(runner, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/a"])
+def test_delete_todo(runner, cli_env, make_todo) -> None:
+    make_todo("feat/a")
 
-        result = runner.invoke(cli, ["delete", "1"])
-        assert result.exit_code == 0
-        assert "Deleted #1" in result.output
+    result = runner.invoke(cli, ["delete", "1"])
+    assert result.exit_code == 0
+    assert "Deleted #1" in result.output
 
-        result = runner.invoke(cli, ["list"])
-        assert "No work items found" in result.output
+    result = runner.invoke(cli, ["list"])
+    assert "No work items found" in result.output
 
 
-def test_delete_nonexistent(runner, db_conn) -> None:
-    get_conn_fn, _db_path = db_conn
-    with patch("womtrees.db.get_connection", get_conn_fn):
-        result = runner.invoke(cli, ["delete", "999"])
-        assert result.exit_code != 0
-        assert "not found" in result.output
+def test_delete_nonexistent(runner, cli_env) -> None:
+    result = runner.invoke(cli, ["delete", "999"])
+    assert result.exit_code != 0
+    assert "not found" in result.output
 
 
 def test_config_show(runner, tmp_path) -> None:
@@ -222,25 +221,20 @@ def test_config_show(runner, tmp_path) -> None:
 # Phase 2: tmux integration tests
 
 
-def test_start_creates_tmux_session(runner, db_conn, tmp_path) -> None:
+def test_start_creates_tmux_session(
+    runner, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test that wt start creates a tmux session and updates the work item."""
-    get_conn_fn, _db_path = db_conn
-
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "left"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT}
-    mock_config.default_layout = "standard"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT}
-    mock_config.default_layout = "standard"
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="left",
+        layouts={"standard": STANDARD_LAYOUT},
+        default_layout="standard",
+        claude_args="",
+    )
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
@@ -250,55 +244,40 @@ def test_start_creates_tmux_session(runner, db_conn, tmp_path) -> None:
             "womtrees.services.workitem.load_womtrees_config",
             return_value=None,
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch(
-            "womtrees.tmux.create_session",
-            return_value=("myrepo/feat-x", "%0"),
-        ) as mock_create,
-        patch("womtrees.tmux.set_environment") as mock_setenv,
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.split_pane", return_value="%1") as mock_split,
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys"),
     ):
-        runner.invoke(cli, ["todo", "test prompt", "-b", "feat/x"])
+        make_todo("feat/x", "test prompt", name="test-prompt")
 
         result = runner.invoke(cli, ["start", "1"])
         assert result.exit_code == 0
         assert "Started #1" in result.output
         assert "myrepo/feat-x" in result.output
 
-        mock_create.assert_called_once()
+        tmux_mock.create_session.assert_called_once()
         # Env vars are now passed directly to create_session via env=
-        _args, _kwargs = mock_create.call_args
+        _args, _kwargs = tmux_mock.create_session.call_args
         env = _kwargs.get("env") or (_args[2] if len(_args) > 2 else None)
         assert env == {
             "WOMTREE_WORK_ITEM_ID": "1",
             "WOMTREE_NAME": "test-prompt",
             "WOMTREE_BRANCH": "feat/x",
         }
-        mock_split.assert_called_once()
+        tmux_mock.split_pane.assert_called_once()
 
 
-def test_start_claude_pane_position(runner, db_conn, tmp_path) -> None:
+def test_start_claude_pane_position(
+    runner, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test that claude pane position matches layout config (right = shell first)."""
-    get_conn_fn, _db_path = db_conn
-
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "right"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT_RIGHT}
-    mock_config.default_layout = "standard"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT_RIGHT}
-    mock_config.default_layout = "standard"
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="right",
+        layouts={"standard": STANDARD_LAYOUT_RIGHT},
+        default_layout="standard",
+        claude_args="",
+    )
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
@@ -308,227 +287,162 @@ def test_start_claude_pane_position(runner, db_conn, tmp_path) -> None:
             "womtrees.services.workitem.load_womtrees_config",
             return_value=None,
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch("womtrees.tmux.create_session", return_value=("myrepo/feat-x", "%0")),
-        patch("womtrees.tmux.set_environment"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.split_pane", return_value="%1"),
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys") as mock_send_keys,
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
+        make_todo("feat/x")
         result = runner.invoke(cli, ["start", "1"])
         assert result.exit_code == 0
         # Claude should be sent to second pane (%1), not first (%0)
-        claude_calls = [c for c in mock_send_keys.call_args_list if "claude" in c[0][1]]
+        claude_calls = [
+            c for c in tmux_mock.send_keys.call_args_list if "claude" in c[0][1]
+        ]
         assert len(claude_calls) == 1
         assert claude_calls[0][0][0] == "%1"
 
 
-def test_start_fails_without_tmux(runner, db_conn) -> None:
+def test_start_fails_without_tmux(runner, cli_env, tmux_mock, make_todo) -> None:
     """Test that start fails gracefully when tmux is not installed."""
-    get_conn_fn, _db_path = db_conn
+    mock_config = SimpleNamespace()
 
-    mock_config = MagicMock()
+    tmux_mock.is_available.return_value = False
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
-        patch("womtrees.tmux.is_available", return_value=False),
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
+        make_todo("feat/x")
         result = runner.invoke(cli, ["start", "1"])
         assert result.exit_code != 0
         assert "tmux is required" in result.output
 
 
-def test_delete_kills_tmux_session(runner, db_conn, tmp_path) -> None:
+def test_delete_kills_tmux_session(
+    runner, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test that deleting a work item kills its tmux session."""
-    get_conn_fn, _db_path = db_conn
-
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "left"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT}
-    mock_config.default_layout = "standard"
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="left",
+        layouts={"standard": STANDARD_LAYOUT},
+        default_layout="standard",
+        claude_args="",
+    )
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
             return_value=tmp_path / "worktrees" / "myrepo" / "feat-x",
         ),
         patch("womtrees.services.workitem.remove_worktree"),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch("womtrees.tmux.create_session", return_value=("myrepo/feat-x", "%0")),
-        patch("womtrees.tmux.set_environment"),
         patch("womtrees.services.workitem.load_womtrees_config", return_value=None),
-        patch("womtrees.tmux.split_pane", return_value="%1"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys"),
-        patch("womtrees.tmux.session_exists", return_value=True),
-        patch("womtrees.tmux.kill_session") as mock_kill,
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
-        runner.invoke(cli, ["start", "1"])
+        make_todo("feat/x")
+        _call(start, item_id=1)
 
         result = runner.invoke(cli, ["delete", "1", "--force"], input="y\n")
         assert result.exit_code == 0
         assert "Deleted #1" in result.output
-        mock_kill.assert_called_once_with("myrepo/feat-x")
+        tmux_mock.kill_session.assert_called_once_with("myrepo/feat-x")
 
 
-def test_attach_command(runner, db_conn, tmp_path) -> None:
+def test_attach_command(runner, cli_env, tmux_mock, make_todo, tmp_path) -> None:
     """Test wt attach jumps to the tmux session."""
-    get_conn_fn, _db_path = db_conn
-
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "left"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT}
-    mock_config.default_layout = "standard"
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="left",
+        layouts={"standard": STANDARD_LAYOUT},
+        default_layout="standard",
+        claude_args="",
+    )
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
             return_value=tmp_path / "worktrees" / "myrepo" / "feat-x",
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch("womtrees.tmux.create_session", return_value=("myrepo/feat-x", "%0")),
-        patch("womtrees.tmux.set_environment"),
         patch("womtrees.services.workitem.load_womtrees_config", return_value=None),
-        patch("womtrees.tmux.split_pane", return_value="%1"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys"),
-        patch("womtrees.tmux.session_exists", return_value=True),
-        patch("womtrees.tmux.attach") as mock_attach,
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
-        runner.invoke(cli, ["start", "1"])
+        make_todo("feat/x")
+        _call(start, item_id=1)
 
         result = runner.invoke(cli, ["attach", "1"])
         assert result.exit_code == 0
-        mock_attach.assert_called_once_with("myrepo/feat-x")
+        tmux_mock.attach.assert_called_once_with("myrepo/feat-x")
 
 
-def test_attach_rejects_todo_item(runner, db_conn) -> None:
+def test_attach_rejects_todo_item(runner, cli_env, make_todo) -> None:
     """Test that wt attach refuses to jump into a TODO work item."""
-    get_conn_fn, _db_path = db_conn
+    make_todo("feat/x")
 
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
-
-        result = runner.invoke(cli, ["attach", "1"])
-        assert result.exit_code == 1
-        assert "TODO" in result.output
-        assert "Start it first" in result.output
+    result = runner.invoke(cli, ["attach", "1"])
+    assert result.exit_code == 1
+    assert "TODO" in result.output
+    assert "Start it first" in result.output
 
 
-def test_attach_restores_missing_session(runner, db_conn) -> None:
+def test_attach_restores_missing_session(
+    runner, db_conn, cli_env, tmux_mock, make_todo
+) -> None:
     """Test wt attach recreates tmux session when it no longer exists."""
-    get_conn_fn, _db_path = db_conn
+    get_conn_fn, _name = db_conn
 
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-        patch("womtrees.tmux.session_exists") as mock_exists,
-        patch(
-            "womtrees.tmux.create_session",
-            return_value=("myrepo-feat-x", "%0"),
-        ) as mock_create,
-        patch("womtrees.tmux.set_environment") as mock_setenv,
-        patch("womtrees.tmux.attach") as mock_attach,
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
+    tmux_mock.create_session.return_value = ("myrepo-feat-x", "%0")
 
-        # Move item out of todo so attach is allowed
-        from womtrees.db import update_work_item
+    make_todo("feat/x")
 
-        conn = get_conn_fn()
-        update_work_item(conn, 1, status="working")
-        conn.close()
+    # Move item out of todo so attach is allowed
+    from womtrees.db import update_work_item
 
-        # Session doesn't exist initially, then exists after restore
-        mock_exists.side_effect = [False, True]
-
-        result = runner.invoke(cli, ["attach", "1"])
-        assert result.exit_code == 0
-        assert "Restored tmux session" in result.output
-        mock_create.assert_called_once()
-        # Env vars are now passed directly to create_session via env=
-        _args, _kwargs = mock_create.call_args
-        env = _kwargs.get("env") or (_args[2] if len(_args) > 2 else None)
-        assert env is not None
-        assert "WOMTREE_WORK_ITEM_ID" in env
-        mock_attach.assert_called_once()
+    conn = get_conn_fn()
+    update_work_item(conn, 1, status="working")
+    conn.close()
 
+    # Session doesn't exist initially, then exists after restore
+    tmux_mock.session_exists.side_effect = [False, True]
 
-def test_attach_resumes_dead_session(runner, db_conn, tmp_path) -> None:
+    result = runner.invoke(cli, ["attach", "1"])
+    assert result.exit_code == 0
+    assert "Restored tmux session" in result.output
+    tmux_mock.create_session.assert_called_once()
+    # Env vars are now passed directly to create_session via env=
+    _args, _kwargs = tmux_mock.create_session.call_args
+    env = _kwargs.get("env") or (_args[2] if len(_args) > 2 else None)
+    assert env is not None
+    assert "WOMTREE_WORK_ITEM_ID" in env
+    tmux_mock.attach.assert_called_once()
+
+
+def test_attach_resumes_dead_session(
+    runner, db_conn, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test that wt attach relaunches Claude if the process is dead."""
-    get_conn_fn, _db_path = db_conn
+    get_conn_fn, _name = db_conn
+
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="left",
+        layouts={"standard": STANDARD_LAYOUT},
+        default_layout="standard",
+        claude_args="",
+    )
 
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "left"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT}
-    mock_config.default_layout = "standard"
-    mock_config.claude_args = ""
+    tmux_mock.create_session.return_value = ("myrepo-feat-x", "%0")
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch("womtrees.cli.info.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
             return_value=tmp_path / "worktrees" / "myrepo" / "feat-x",
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch("womtrees.tmux.create_session", return_value=("myrepo-feat-x", "%0")),
-        patch("womtrees.tmux.set_environment"),
         patch("womtrees.services.workitem.load_womtrees_config", return_value=None),
-        patch("womtrees.tmux.split_pane", return_value="%1"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys") as mock_send_keys,
-        patch("womtrees.tmux.session_exists", return_value=True),
-        patch("womtrees.tmux.attach"),
         patch("womtrees.claude.is_pid_alive", return_value=False),
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
-        runner.invoke(cli, ["start", "1"])
+        make_todo("feat/x")
+        _call(start, item_id=1)
 
         # Update the session to have a claude_session_id and PID
         conn = get_conn_fn()
@@ -542,55 +456,46 @@ def test_attach_resumes_dead_session(runner, db_conn, tmp_path) -> None:
             pid=99999,
         )
 
-        mock_send_keys.reset_mock()
+        tmux_mock.send_keys.reset_mock()
 
         result = runner.invoke(cli, ["attach", "1"])
         assert result.exit_code == 0
 
         # Should have sent claude --resume to the pane
-        mock_send_keys.assert_called_once()
-        call_args = mock_send_keys.call_args
+        tmux_mock.send_keys.assert_called_once()
+        call_args = tmux_mock.send_keys.call_args
         assert "--resume test-uuid-123" in call_args[0][1]
 
 
-def test_attach_resumes_with_continue_fallback(runner, db_conn, tmp_path) -> None:
+def test_attach_resumes_with_continue_fallback(
+    runner, db_conn, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test that wt attach falls back to --continue if no session_id."""
-    get_conn_fn, _db_path = db_conn
+    get_conn_fn, _name = db_conn
+
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="left",
+        layouts={"standard": STANDARD_LAYOUT},
+        default_layout="standard",
+        claude_args="",
+    )
 
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "left"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT}
-    mock_config.default_layout = "standard"
-    mock_config.claude_args = ""
+    tmux_mock.create_session.return_value = ("myrepo-feat-x", "%0")
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch("womtrees.cli.info.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
             return_value=tmp_path / "worktrees" / "myrepo" / "feat-x",
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch("womtrees.tmux.create_session", return_value=("myrepo-feat-x", "%0")),
-        patch("womtrees.tmux.set_environment"),
         patch("womtrees.services.workitem.load_womtrees_config", return_value=None),
-        patch("womtrees.tmux.split_pane", return_value="%1"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys") as mock_send_keys,
-        patch("womtrees.tmux.session_exists", return_value=True),
-        patch("womtrees.tmux.attach"),
         patch("womtrees.claude.is_pid_alive", return_value=False),
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
-        runner.invoke(cli, ["start", "1"])
+        make_todo("feat/x")
+        _call(start, item_id=1)
 
         # Set a PID so resume check runs (no claude_session_id → fallback)
         conn = get_conn_fn()
@@ -599,109 +504,87 @@ def test_attach_resumes_with_continue_fallback(runner, db_conn, tmp_path) -> Non
         sessions = list_claude_sessions(conn)
         update_claude_session(conn, sessions[0].id, pid=99999)
 
-        mock_send_keys.reset_mock()
+        tmux_mock.send_keys.reset_mock()
 
         result = runner.invoke(cli, ["attach", "1"])
         assert result.exit_code == 0
 
         # Should have sent claude --continue (no session_id stored)
-        mock_send_keys.assert_called_once()
-        call_args = mock_send_keys.call_args
+        tmux_mock.send_keys.assert_called_once()
+        call_args = tmux_mock.send_keys.call_args
         assert "--continue" in call_args[0][1]
 
 
-def test_attach_skips_resume_if_alive(runner, db_conn, tmp_path) -> None:
+def test_attach_skips_resume_if_alive(
+    runner, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test that wt attach does NOT relaunch Claude if process is alive."""
-    get_conn_fn, _db_path = db_conn
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="left",
+        layouts={"standard": STANDARD_LAYOUT},
+        default_layout="standard",
+        claude_args="",
+    )
 
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "left"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT}
-    mock_config.default_layout = "standard"
-    mock_config.claude_args = ""
+    tmux_mock.create_session.return_value = ("myrepo-feat-x", "%0")
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
             return_value=tmp_path / "worktrees" / "myrepo" / "feat-x",
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch("womtrees.tmux.create_session", return_value=("myrepo-feat-x", "%0")),
-        patch("womtrees.tmux.set_environment"),
         patch("womtrees.services.workitem.load_womtrees_config", return_value=None),
-        patch("womtrees.tmux.split_pane", return_value="%1"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys") as mock_send_keys,
-        patch("womtrees.tmux.session_exists", return_value=True),
-        patch("womtrees.tmux.attach"),
         patch("womtrees.claude.is_pid_alive", return_value=True),
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
-        runner.invoke(cli, ["start", "1"])
+        make_todo("feat/x")
+        _call(start, item_id=1)
 
-        mock_send_keys.reset_mock()
+        tmux_mock.send_keys.reset_mock()
 
         result = runner.invoke(cli, ["attach", "1"])
         assert result.exit_code == 0
 
         # Should NOT have sent any resume command
-        mock_send_keys.assert_not_called()
+        tmux_mock.send_keys.assert_not_called()
 
 
 def test_attach_skips_resume_if_another_session_alive(
-    runner, db_conn, tmp_path
+    runner, db_conn, cli_env, tmux_mock, make_todo, tmp_path
 ) -> None:
     """Don't resume a dead session when another session is still running."""
-    get_conn_fn, _db_path = db_conn
-
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "left"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT}
-    mock_config.default_layout = "standard"
-    mock_config.claude_args = ""
+    get_conn_fn, _name = db_conn
+
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="left",
+        layouts={"standard": STANDARD_LAYOUT},
+        default_layout="standard",
+        claude_args="",
+    )
 
     def pid_alive(pid):
         # PID 11111 is dead (target), PID 22222 is alive (other session)
         return pid == 22222
 
+    tmux_mock.create_session.return_value = ("myrepo-feat-x", "%0")
+
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch("womtrees.cli.info.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
             return_value=tmp_path / "worktrees" / "myrepo" / "feat-x",
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch("womtrees.tmux.create_session", return_value=("myrepo-feat-x", "%0")),
-        patch("womtrees.tmux.set_environment"),
         patch("womtrees.services.workitem.load_womtrees_config", return_value=None),
-        patch("womtrees.tmux.split_pane", return_value="%1"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys") as mock_send_keys,
-        patch("womtrees.tmux.session_exists", return_value=True),
-        patch("womtrees.tmux.attach"),
         patch("womtrees.claude.is_pid_alive", side_effect=pid_alive),
     ):
         # Create two work items with sessions
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
-        runner.invoke(cli, ["start", "1"])
+        make_todo("feat/x")
+        _call(start, item_id=1)
 
         conn = get_conn_fn()
         from womtrees.db import list_claude_sessions, update_claude_session
@@ -716,155 +599,119 @@ def test_attach_skips_resume_if_another_session_alive(
         )
 
         # Create a second work item + session with a live PID
-        runner.invoke(cli, ["todo", "-b", "feat/y"])
-        with patch(
-            "womtrees.tmux.create_session",
-            return_value=("myrepo-feat-y", "%2"),
-        ):
-            runner.invoke(cli, ["start", "2"])
+        make_todo("feat/y")
+        tmux_mock.create_session.return_value = ("myrepo-feat-y", "%2")
+        _call(start, item_id=2)
         sessions = list_claude_sessions(conn, work_item_id=2)
         update_claude_session(conn, sessions[0].id, pid=22222)
 
-        mock_send_keys.reset_mock()
+        tmux_mock.send_keys.reset_mock()
 
         result = runner.invoke(cli, ["attach", "1"])
         assert result.exit_code == 0
 
         # Should NOT resume — another session is still alive
-        mock_send_keys.assert_not_called()
+        tmux_mock.send_keys.assert_not_called()
 
 
-def test_todo_with_repo_option(runner, db_conn, tmp_path) -> None:
+def test_todo_with_repo_option(runner, db_conn, cli_env, tmp_path) -> None:
     """Test that -r option overrides current repo detection."""
-    get_conn_fn, _db_path = db_conn
+    get_conn_fn, _name = db_conn
     target_repo = tmp_path / "other-project"
     target_repo.mkdir()
 
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        result = runner.invoke(
-            cli,
-            ["todo", "-b", "feat/x", "-r", str(target_repo), "some task"],
-        )
-        assert result.exit_code == 0
-        assert "Created TODO #1" in result.output
+    result = runner.invoke(
+        cli,
+        ["todo", "-b", "feat/x", "-r", str(target_repo), "some task"],
+    )
+    assert result.exit_code == 0
+    assert "Created TODO #1" in result.output
 
-        # Verify the item was created with the specified repo
-        conn = get_conn_fn()
-        from womtrees.db import get_work_item
+    # Verify the item was created with the specified repo
+    conn = get_conn_fn()
+    from womtrees.db import get_work_item
 
-        item = get_work_item(conn, 1)
-        assert item.repo_name == "other-project"
-        assert item.repo_path == str(target_repo)
+    item = get_work_item(conn, 1)
+    assert item.repo_name == "other-project"
+    assert item.repo_path == str(target_repo)
 
 
-def test_todo_with_repo_option_no_git_required(runner, db_conn, tmp_path) -> None:
+def test_todo_with_repo_option_no_git_required(
+    runner, cli_env, monkeypatch, tmp_path
+) -> None:
     """Test that -r works even when not in a git repo."""
-    get_conn_fn, _db_path = db_conn
     target_repo = tmp_path / "standalone"
     target_repo.mkdir()
 
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch("womtrees.cli.utils.get_current_repo", return_value=None),
-    ):
-        result = runner.invoke(
-            cli,
-            ["todo", "-b", "feat/y", "-r", str(target_repo), "some task"],
-        )
-        assert result.exit_code == 0
-        assert "Created TODO #1" in result.output
+    monkeypatch.setattr("womtrees.cli.utils.get_current_repo", lambda: None)
+    result = runner.invoke(
+        cli,
+        ["todo", "-b", "feat/y", "-r", str(target_repo), "some task"],
+    )
+    assert result.exit_code == 0
+    assert "Created TODO #1" in result.output
 
 
-def test_edit_name_only(runner, db_conn) -> None:
+def test_edit_name_only(runner, db_conn, cli_env, make_todo) -> None:
     """Test editing just the name of a todo item."""
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/x", "-n", "old name"])
-        result = runner.invoke(cli, ["edit", "1", "--name", "new name"])
-        assert result.exit_code == 0
-        assert "Updated #1" in result.output
+    get_conn_fn, _name = db_conn
+    make_todo("feat/x", name="old name")
+    result = runner.invoke(cli, ["edit", "1", "--name", "new name"])
+    assert result.exit_code == 0
+    assert "Updated #1" in result.output
 
-        conn = get_conn_fn()
-        from womtrees.db import get_work_item
+    conn = get_conn_fn()
+    from womtrees.db import get_work_item
 
-        item = get_work_item(conn, 1)
-        assert item.name == "new name"
-        assert item.branch == "feat/x"
+    item = get_work_item(conn, 1)
+    assert item.name == "new name"
+    assert item.branch == "feat/x"
 
 
-def test_edit_branch_todo_item(runner, db_conn) -> None:
+def test_edit_branch_todo_item(runner, db_conn, cli_env, make_todo) -> None:
     """Test editing the branch of a todo item (no worktree)."""
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/old"])
-        result = runner.invoke(cli, ["edit", "1", "--branch", "feat/new"])
-        assert result.exit_code == 0
-        assert "Updated #1" in result.output
+    get_conn_fn, _name = db_conn
+    make_todo("feat/old")
+    result = runner.invoke(cli, ["edit", "1", "--branch", "feat/new"])
+    assert result.exit_code == 0
+    assert "Updated #1" in result.output
 
-        conn = get_conn_fn()
-        from womtrees.db import get_work_item
+    conn = get_conn_fn()
+    from womtrees.db import get_work_item
 
-        item = get_work_item(conn, 1)
-        assert item.branch == "feat/new"
+    item = get_work_item(conn, 1)
+    assert item.branch == "feat/new"
 
 
-def test_edit_branch_active_item(runner, db_conn, tmp_path) -> None:
+def test_edit_branch_active_item(
+    runner, db_conn, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test editing branch on an active item renames the git branch."""
-    get_conn_fn, _db_path = db_conn
+    get_conn_fn, _name = db_conn
+
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="right",
+        layouts={"standard": STANDARD_LAYOUT_RIGHT},
+        default_layout="standard",
+        claude_args="",
+    )
 
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "right"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT_RIGHT}
-    mock_config.default_layout = "standard"
+    tmux_mock.create_session.return_value = ("myrepo/feat-old", "%0")
+    tmux_mock.rename_session.return_value = "myrepo-feat-new"
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
             return_value=tmp_path / "worktrees" / "myrepo" / "feat-old",
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch("womtrees.tmux.create_session", return_value=("myrepo/feat-old", "%0")),
-        patch("womtrees.tmux.set_environment"),
         patch("womtrees.services.workitem.load_womtrees_config", return_value=None),
-        patch("womtrees.tmux.split_pane", return_value="%1"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys"),
-        patch("womtrees.tmux.session_exists", return_value=True),
         patch("womtrees.services.workitem.rename_branch") as mock_rename,
-        patch(
-            "womtrees.tmux.rename_session",
-            return_value="myrepo-feat-new",
-        ) as mock_rename_session,
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/old"])
-        runner.invoke(cli, ["start", "1"])
+        make_todo("feat/old")
+        _call(start, item_id=1)
 
         result = runner.invoke(cli, ["edit", "1", "--branch", "feat/new"])
         assert result.exit_code == 0
@@ -875,7 +722,7 @@ def test_edit_branch_active_item(runner, db_conn, tmp_path) -> None:
             "feat/old",
             "feat/new",
         )
-        mock_rename_session.assert_called_once()
+        tmux_mock.rename_session.assert_called_once()
 
         conn = get_conn_fn()
         from womtrees.db import get_work_item
@@ -887,99 +734,69 @@ def test_edit_branch_active_item(runner, db_conn, tmp_path) -> None:
         assert item.tmux_session == "myrepo-feat-new"
 
 
-def test_edit_branch_blocked_by_open_pr(runner, db_conn) -> None:
+def test_edit_branch_blocked_by_open_pr(runner, db_conn, cli_env, make_todo) -> None:
     """Test that editing branch is rejected when an open PR exists."""
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
+    get_conn_fn, _name = db_conn
+    make_todo("feat/x")
 
-        from womtrees.db import create_pull_request
+    from womtrees.db import create_pull_request
 
-        conn = get_conn_fn()
-        create_pull_request(conn, 1, number=42, owner="user", repo="myrepo")
+    conn = get_conn_fn()
+    create_pull_request(conn, 1, number=42, owner="user", repo="myrepo")
 
-        result = runner.invoke(cli, ["edit", "1", "--branch", "feat/y"])
-        assert result.exit_code != 0
-        assert "open PR" in result.output
+    result = runner.invoke(cli, ["edit", "1", "--branch", "feat/y"])
+    assert result.exit_code != 0
+    assert "open PR" in result.output
 
 
-def test_edit_duplicate_branch(runner, db_conn) -> None:
+def test_edit_duplicate_branch(runner, cli_env, make_todo) -> None:
     """Test that editing to a duplicate active branch is rejected."""
-    get_conn_fn, _db_path = db_conn
-    with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
-    ):
-        runner.invoke(cli, ["todo", "-b", "feat/a"])
-        runner.invoke(cli, ["todo", "-b", "feat/b"])
+    make_todo("feat/a")
+    make_todo("feat/b")
 
-        result = runner.invoke(cli, ["edit", "2", "--branch", "feat/a"])
-        assert result.exit_code != 0
-        assert "already used" in result.output
+    result = runner.invoke(cli, ["edit", "2", "--branch", "feat/a"])
+    assert result.exit_code != 0
+    assert "already used" in result.output
 
 
-def test_edit_no_options(runner, db_conn) -> None:
+def test_edit_no_options(runner, cli_env) -> None:
     """Test that edit requires at least --name or --branch."""
-    get_conn_fn, _db_path = db_conn
-    with patch("womtrees.db.get_connection", get_conn_fn):
-        result = runner.invoke(cli, ["edit", "1"])
-        assert result.exit_code != 0
-        assert "Provide --name, --branch, and/or --prompt" in result.output
+    result = runner.invoke(cli, ["edit", "1"])
+    assert result.exit_code != 0
+    assert "Provide --name, --branch, and/or --prompt" in result.output
 
 
-def test_edit_nonexistent(runner, db_conn) -> None:
+def test_edit_nonexistent(runner, cli_env) -> None:
     """Test editing a non-existent item."""
-    get_conn_fn, _db_path = db_conn
-    with patch("womtrees.db.get_connection", get_conn_fn):
-        result = runner.invoke(cli, ["edit", "999", "--name", "test"])
-        assert result.exit_code != 0
-        assert "not found" in result.output
+    result = runner.invoke(cli, ["edit", "999", "--name", "test"])
+    assert result.exit_code != 0
+    assert "not found" in result.output
 
 
-def test_create_with_repo_option(runner, db_conn, tmp_path) -> None:
+def test_create_with_repo_option(runner, db_conn, cli_env, tmux_mock, tmp_path) -> None:
     """Test that create command also accepts -r option."""
-    get_conn_fn, _db_path = db_conn
+    get_conn_fn, _name = db_conn
     target_repo = tmp_path / "another-project"
     target_repo.mkdir()
 
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.tmux_split = "vertical"
-    mock_config.tmux_claude_pane = "right"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT_RIGHT}
-    mock_config.default_layout = "standard"
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        tmux_split="vertical",
+        tmux_claude_pane="right",
+        layouts={"standard": STANDARD_LAYOUT_RIGHT},
+        default_layout="standard",
+        claude_args="",
+    )
+
+    tmux_mock.create_session.return_value = ("another-project/feat-z", "%0")
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
             return_value=tmp_path / "worktrees" / "another-project" / "feat-z",
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch(
-            "womtrees.tmux.create_session",
-            return_value=("another-project/feat-z", "%0"),
-        ),
-        patch("womtrees.tmux.set_environment"),
         patch("womtrees.services.workitem.load_womtrees_config", return_value=None),
-        patch("womtrees.tmux.split_pane", return_value="%1"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.select_layout"),
-        patch("womtrees.tmux.send_keys"),
     ):
         result = runner.invoke(cli, ["create", "-b", "feat/z", "-r", str(target_repo)])
         assert result.exit_code == 0
@@ -995,10 +812,10 @@ def test_create_with_repo_option(runner, db_conn, tmp_path) -> None:
 # -- Layout tests --
 
 
-def test_start_multi_window_layout(runner, db_conn, tmp_path) -> None:
+def test_start_multi_window_layout(
+    runner, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test start_work_item with a multi-window layout."""
-    get_conn_fn, _db_path = db_conn
-
     multi_layout = LayoutConfig(
         windows=[
             WindowConfig(
@@ -1017,17 +834,17 @@ def test_start_multi_window_layout(runner, db_conn, tmp_path) -> None:
         ]
     )
 
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.layouts = {"dev-server": multi_layout}
-    mock_config.default_layout = "dev-server"
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        layouts={"dev-server": multi_layout},
+        default_layout="dev-server",
+        claude_args="",
+    )
+
+    tmux_mock.new_window.return_value = "%2"
+    tmux_mock.split_pane.side_effect = ["%1", "%3"]
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
@@ -1037,55 +854,45 @@ def test_start_multi_window_layout(runner, db_conn, tmp_path) -> None:
             "womtrees.services.workitem.load_womtrees_config",
             return_value=None,
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch(
-            "womtrees.tmux.create_session",
-            return_value=("myrepo/feat-x", "%0"),
-        ),
-        patch("womtrees.tmux.set_environment"),
-        patch("womtrees.tmux.rename_window") as mock_rename_win,
-        patch("womtrees.tmux.new_window", return_value="%2") as mock_new_win,
-        patch("womtrees.tmux.split_pane", side_effect=["%1", "%3"]) as mock_split,
-        patch("womtrees.tmux.select_layout") as mock_sel_layout,
-        patch("womtrees.tmux.select_window") as mock_sel_win,
-        patch("womtrees.tmux.send_keys") as mock_send_keys,
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
+        make_todo("feat/x")
         result = runner.invoke(cli, ["start", "1"])
         assert result.exit_code == 0
 
         # First window renamed
-        mock_rename_win.assert_called_once_with("%0", "code")
+        tmux_mock.rename_window.assert_called_once_with("%0", "code")
 
         # First window selected after loop (so it's active on attach)
-        mock_sel_win.assert_called_once_with("%0")
+        tmux_mock.select_window.assert_called_once_with("%0")
 
         # Second window created
-        mock_new_win.assert_called_once_with(
+        tmux_mock.new_window.assert_called_once_with(
             "myrepo/feat-x",
             "services",
             str(tmp_path / "worktrees" / "myrepo" / "feat-x"),
         )
 
         # Two split_pane calls (one per window for second pane)
-        assert mock_split.call_count == 2
+        assert tmux_mock.split_pane.call_count == 2
 
         # select_layout called for both windows
-        assert mock_sel_layout.call_count == 2
-        mock_sel_layout.assert_any_call("myrepo/feat-x:code", "even-horizontal")
-        mock_sel_layout.assert_any_call("myrepo/feat-x:services", "even-vertical")
+        assert tmux_mock.select_layout.call_count == 2
+        tmux_mock.select_layout.assert_any_call("myrepo/feat-x:code", "even-horizontal")
+        tmux_mock.select_layout.assert_any_call(
+            "myrepo/feat-x:services", "even-vertical"
+        )
 
         # Commands sent: claude to %0, npm run dev to %2, npm run test to %3
-        send_calls = {c[0][0]: c[0][1] for c in mock_send_keys.call_args_list}
+        send_calls = {c[0][0]: c[0][1] for c in tmux_mock.send_keys.call_args_list}
         assert "claude" in send_calls["%0"]
         assert send_calls["%2"] == "npm run dev"
         assert send_calls["%3"] == "npm run test"
 
 
-def test_start_womtrees_toml_layout_override(runner, db_conn, tmp_path) -> None:
+def test_start_womtrees_toml_layout_override(
+    runner, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test .womtrees.toml layout override."""
-    get_conn_fn, _db_path = db_conn
-
     three_pane = LayoutConfig(
         windows=[
             WindowConfig(
@@ -1100,20 +907,19 @@ def test_start_womtrees_toml_layout_override(runner, db_conn, tmp_path) -> None:
         ]
     )
 
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.layouts = {
-        "standard": STANDARD_LAYOUT,
-        "three-pane": three_pane,
-    }
-    mock_config.default_layout = "standard"
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        layouts={
+            "standard": STANDARD_LAYOUT,
+            "three-pane": three_pane,
+        },
+        default_layout="standard",
+        claude_args="",
+    )
+
+    tmux_mock.split_pane.side_effect = ["%1", "%2"]
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
@@ -1123,48 +929,37 @@ def test_start_womtrees_toml_layout_override(runner, db_conn, tmp_path) -> None:
             "womtrees.services.workitem.load_womtrees_config",
             return_value={"layout": "three-pane"},
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch(
-            "womtrees.tmux.create_session",
-            return_value=("myrepo/feat-x", "%0"),
-        ),
-        patch("womtrees.tmux.set_environment"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.split_pane", side_effect=["%1", "%2"]) as mock_split,
-        patch("womtrees.tmux.select_layout") as mock_sel_layout,
-        patch("womtrees.tmux.send_keys") as mock_send_keys,
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
+        make_todo("feat/x")
         result = runner.invoke(cli, ["start", "1"])
         assert result.exit_code == 0
 
         # Two extra panes created (3 total, first comes free)
-        assert mock_split.call_count == 2
+        assert tmux_mock.split_pane.call_count == 2
 
         # Layout applied
-        mock_sel_layout.assert_called_once_with("myrepo/feat-x:main", "main-vertical")
+        tmux_mock.select_layout.assert_called_once_with(
+            "myrepo/feat-x:main", "main-vertical"
+        )
 
         # Commands: claude to %0, tail to %2
-        send_calls = {c[0][0]: c[0][1] for c in mock_send_keys.call_args_list}
+        send_calls = {c[0][0]: c[0][1] for c in tmux_mock.send_keys.call_args_list}
         assert "claude" in send_calls["%0"]
         assert send_calls["%2"] == "tail -f log"
 
 
-def test_start_fallback_to_standard_layout(runner, db_conn, tmp_path) -> None:
+def test_start_fallback_to_standard_layout(
+    runner, cli_env, tmux_mock, make_todo, tmp_path
+) -> None:
     """Test that missing .womtrees.toml falls back to standard layout."""
-    get_conn_fn, _db_path = db_conn
-
-    mock_config = MagicMock()
-    mock_config.base_dir = tmp_path / "worktrees"
-    mock_config.layouts = {"standard": STANDARD_LAYOUT}
-    mock_config.default_layout = "standard"
+    mock_config = SimpleNamespace(
+        base_dir=tmp_path / "worktrees",
+        layouts={"standard": STANDARD_LAYOUT},
+        default_layout="standard",
+        claude_args="",
+    )
 
     with (
-        patch("womtrees.db.get_connection", get_conn_fn),
-        patch(
-            "womtrees.cli.utils.get_current_repo",
-            return_value=("myrepo", "/tmp/myrepo"),
-        ),
         patch("womtrees.cli.items.get_config", return_value=mock_config),
         patch(
             "womtrees.services.workitem.create_worktree",
@@ -1174,29 +969,23 @@ def test_start_fallback_to_standard_layout(runner, db_conn, tmp_path) -> None:
             "womtrees.services.workitem.load_womtrees_config",
             return_value=None,
         ),
-        patch("womtrees.tmux.is_available", return_value=True),
-        patch(
-            "womtrees.tmux.create_session",
-            return_value=("myrepo/feat-x", "%0"),
-        ),
-        patch("womtrees.tmux.set_environment"),
-        patch("womtrees.tmux.rename_window"),
-        patch("womtrees.tmux.split_pane", return_value="%1") as mock_split,
-        patch("womtrees.tmux.select_layout") as mock_sel_layout,
-        patch("womtrees.tmux.send_keys") as mock_send_keys,
     ):
-        runner.invoke(cli, ["todo", "-b", "feat/x"])
+        make_todo("feat/x")
         result = runner.invoke(cli, ["start", "1"])
         assert result.exit_code == 0
 
         # Standard layout: one split (2 panes)
-        mock_split.assert_called_once()
+        tmux_mock.split_pane.assert_called_once()
 
         # Layout applied
-        mock_sel_layout.assert_called_once_with("myrepo/feat-x:main", "even-horizontal")
+        tmux_mock.select_layout.assert_called_once_with(
+            "myrepo/feat-x:main", "even-horizontal"
+        )
 
         # Claude sent to first pane
-        claude_calls = [c for c in mock_send_keys.call_args_list if "claude" in c[0][1]]
+        claude_calls = [
+            c for c in tmux_mock.send_keys.call_args_list if "claude" in c[0][1]
+        ]
         assert len(claude_calls) == 1
         assert claude_calls[0][0][0] == "%0"
 
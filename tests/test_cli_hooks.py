@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 import sqlite3
 from unittest.mock import patch
 
@@ -8,7 +9,6 @@ from click.testing import CliRunner
 
 from womtrees.cli import cli
 from womtrees.db import (
-    _ensure_schema,
     create_claude_session,
     create_work_item,
     get_claude_session,
@@ -18,21 +18,15 @@ from womtrees.db import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
 @pytest.fixture
-def db_conn(tmp_path):
+def db_conn(tmp_path, _db_template):
     db_path = tmp_path / "test.db"
-
-    # Initialize schema once
-    init_conn = sqlite3.connect(str(db_path))
-    init_conn.row_factory = sqlite3.Row
-    init_conn.execute("PRAGMA foreign_keys=ON")
-    _ensure_schema(init_conn)
-    init_conn.close()
+    shutil.copyfile(_db_template, db_path)
 
     def _get_conn(db_path_arg=None):
         c = sqlite3.connect(str(db_path))
@@ -172,3 +172,33 @@ def test_duplicate_branch_allowed_different_repo() -> None:
     # Same branch in a different repo is fine
     item2 = create_work_item(conn, "repo2", "/tmp/repo2", "feat/dup")
     assert item2.branch == "feat/dup"
+
+
+def test_ensure_schema_skips_current_database(tmp_path) -> None:
+    db_path = tmp_path / "test.db"
+    first = sqlite3.connect(db_path)
+    first.row_factory = sqlite3.Row
+    _ensure_schema(first)
+    first.close()
+
+    statements: list[str] = []
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.set_trace_callback(statements.append)
+    _ensure_schema(conn)
+    assert not any("CREATE TABLE" in s for s in statements)
+    assert create_work_item(conn, "repo", "/tmp/repo", "feat/x").id == 1
+
+
+def test_ensure_schema_reinitializes_emptied_file(tmp_path) -> None:
+    """An emptied file keeps its path and inode but still gets a schema."""
+    db_path = tmp_path / "test.db"
+    first = sqlite3.connect(db_path)
+    _ensure_schema(first)
+    first.close()
+    db_path.write_bytes(b"")
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    _ensure_schema(conn)
+    assert create_work_item(conn, "repo", "/tmp/repo", "feat/x").id == 1
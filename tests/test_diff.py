@@ -76,6 +76,16 @@ def test_parse_unified_diff_uses_highlighted():
     assert result[2].highlighted == "NEW_HIGHLIGHTED"
 
 
+def test_diff_line_gutter_and_prefix():
+    """Gutter and prefix are derived from the line numbers and kind."""
+    added = DiffLine("added", None, 12, "x", "x")
+    assert added.gutter == "       12 "
+    assert added.prefix == "+"
+    assert DiffLine("removed", 3, None, "x", "x").prefix == "-"
+    assert DiffLine("context", 3, 4, "x", "x").gutter == "   3    4 "
+    assert DiffLine("hunk_header", None, None, "@@", "@@").prefix == ""
+
+
 def test_highlight_lines_unknown_language():
     """Unknown language returns plain text lines."""
     text = "line1\nline2"
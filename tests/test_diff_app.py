@@ -0,0 +1,231 @@
+"""Tests for the standalone DiffApp."""
+
+from __future__ import annotations
+
+import pytest
+
+from womtrees.diff import DiffFile, DiffLine, DiffResult
+from womtrees.tui.diff_app import DiffApp
+from womtrees.tui.diff_view import DiffView
+
+
+def _make_diff_file(path: str, count: int = 30) -> DiffFile:
+    lines = [
+        DiffLine("context", i + 1, i + 1, f"{path} {i}", f"{path} {i}")
+        for i in range(count)
+    ]
+    return DiffFile(path=path, language=None, lines=lines)
+
+
+def _make_app(tmp_path) -> DiffApp:
+    result = DiffResult(
+        files=[_make_diff_file("a.py"), _make_diff_file("b.py")],
+        base_ref="main",
+        target_ref="HEAD",
+    )
+    return DiffApp(result, repo_path=str(tmp_path))
+
+
+def _add_comment(app: DiffApp, file: str, start: int, end: int) -> None:
+    app._on_comment_submitted(f"note {start}", file, start, end, start + 1, end + 1)
+
+
+@pytest.mark.asyncio
+async def test_navigate_comments_wraps_within_file(tmp_path) -> None:
+    app = _make_app(tmp_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        view = app.query_one(DiffView)
+        _add_comment(app, "a.py", 20, 21)
+        _add_comment(app, "b.py", 3, 3)
+        _add_comment(app, "a.py", 5, 5)
+        await pilot.pause()
+
+        stops = []
+        for _ in range(3):
+            await pilot.press("n")
+            await pilot.pause()
+            stops.append(view.cursor)
+        assert stops == [5, 20, 5]
+
+        await pilot.press("N")
+        await pilot.pause()
+        assert view.cursor == 20
+
+
+@pytest.mark.asyncio
+async def test_comment_index_follows_undo_and_delete(tmp_path) -> None:
+    app = _make_app(tmp_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        _add_comment(app, "a.py", 5, 6)
+        _add_comment(app, "a.py", 2, 2)
+        _add_comment(app, "b.py", 1, 1)
+        assert [c.start_line for c in app._comments_by_file["a.py"]] == [2, 5]
+
+        await pilot.press("u")
+        await pilot.pause()
+        assert "b.py" not in app._comments_by_file
+
+        await pilot.press("j", "j", "x")
+        await pilot.pause()
+        assert [c.start_line for c in app._comments_by_file["a.py"]] == [5]
+        assert [c.start_line for c in app._comments] == [5]
+
+
+@pytest.mark.asyncio
+async def test_edit_comment_at_cursor_updates_both_indexes(tmp_path) -> None:
+    app = _make_app(tmp_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        _add_comment(app, "a.py", 0, 3)
+        _add_comment(app, "b.py", 0, 0)
+        await pilot.press("j", "j")
+        await pilot.pause()
+
+        old = app._comment_at_cursor()
+        assert old is app._comments[0]
+        app._on_edit_submitted("changed", old)
+
+        assert app._comments[0].comment_text == "changed"
+        assert app._comments_by_file["a.py"][0] is app._comments[0]
+        assert app._comments[1].file == "b.py"
+
+
+@pytest.mark.asyncio
+async def test_edit_submitted_after_remap_updates_live_comment(tmp_path) -> None:
+    from dataclasses import replace
+
+    app = _make_app(tmp_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        _add_comment(app, "a.py", 4, 4)
+        await pilot.press("j", "j", "j", "j")
+        await pilot.pause()
+        old = app._comment_at_cursor()
+
+        # A refresh while the dialog is open swaps in moved copies
+        app._comments[0] = replace(old, start_line=6, end_line=6)
+        app._reindex_comments()
+        app._on_edit_submitted("changed", old)
+
+        assert app._comments[0].comment_text == "changed"
+        assert app._comments[0].start_line == 6
+        assert app._comments_by_file["a.py"] == [app._comments[0]]
+
+        # ...or dropped it entirely: submitting is then a no-op
+        app._remove_comment(app._comments[0])
+        app._on_edit_submitted("again", old)
+        assert app._comments == []
+
+
+@pytest.mark.asyncio
+async def test_other_file_comment_skips_diff_view_update(tmp_path) -> None:
+    from unittest.mock import patch
+
+    app = _make_app(tmp_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        _add_comment(app, "a.py", 2, 2)
+        view = app.query_one(DiffView)
+        with patch.object(view, "set_comments") as set_comments:
+            _add_comment(app, "b.py", 1, 1)
+            await pilot.press("u")
+            await pilot.pause()
+        set_comments.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_reload_tree_keeps_unchanged_leaves(tmp_path) -> None:
+    from textual.widgets import Tree
+
+    app = _make_app(tmp_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        tree = app.query_one("#file-tree", Tree)
+        first = tree.root.children[0]
+
+        app._diff.files = [
+            app._diff.files[0],
+            _make_diff_file("c.py"),
+            _make_diff_file("d.py"),
+        ]
+        app._reload_tree()
+        await pilot.pause()
+
+        children = list(tree.root.children)
+        assert children[0] is first
+        assert [str(n.label) for n in children] == ["a.py", "c.py", "d.py"]
+        assert [n.data for n in children] == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_tree_markers_relabel_only_changed_files(tmp_path) -> None:
+    from textual.widgets import Tree
+
+    app = _make_app(tmp_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        tree = app.query_one("#file-tree", Tree)
+        a_node, b_node = tree.root.children
+        b_updates = b_node._updates
+
+        _add_comment(app, "a.py", 1, 1)
+        _add_comment(app, "a.py", 4, 4)
+        await pilot.pause()
+        assert str(a_node.label) == "● a.py"
+        assert b_node._updates == b_updates
+
+        await pilot.press("u", "u")
+        await pilot.pause()
+        assert str(a_node.label) == "a.py"
+        assert b_node._updates == b_updates
+
+
+@pytest.mark.asyncio
+async def test_cycle_mode_fetches_diff_in_worker(tmp_path) -> None:
+    from unittest.mock import patch
+
+    from textual.widgets import Tree
+
+    new_diff = DiffResult(
+        files=[_make_diff_file("b.py"), _make_diff_file("c.py")],
+        base_ref="main",
+        target_ref="working tree",
+    )
+    app = _make_app(tmp_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        with patch("womtrees.diff.list_diff_files", return_value=new_diff) as fetch:
+            await pilot.press("m")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+        assert fetch.call_args.kwargs["uncommitted"] is True
+        assert app._diff is new_diff
+        tree = app.query_one("#file-tree", Tree)
+        assert [str(n.label) for n in tree.root.children] == ["b.py", "c.py"]
+        assert not tree.loading
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_cursor_moved_during_fetch(tmp_path) -> None:
+    """Navigation while git runs is kept when the refreshed diff loads."""
+    import threading
+    from unittest.mock import patch
+
+    new_diff = DiffResult(
+        files=[_make_diff_file("a.py"), _make_diff_file("b.py")],
+        base_ref="main",
+        target_ref="working tree",
+    )
+    release = threading.Event()
+
+    def fetch(*args, **kwargs) -> DiffResult:
+        release.wait(5)
+        return new_diff
+
+    app = _make_app(tmp_path)
+    async with app.run_test(size=(120, 40)) as pilot:
+        with patch("womtrees.diff.list_diff_files", side_effect=fetch):
+            await pilot.press("m")
+            await pilot.press("j", "j", "j")
+            assert app._diff_view.cursor == 3
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+        assert app._diff is new_diff
+        assert app._diff_view.cursor == 3
@@ -0,0 +1,312 @@
+"""Tests for the DiffView widget."""
+
+from __future__ import annotations
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.strip import Strip
+
+from womtrees.diff import DiffFile, DiffLine
+from womtrees.tui.diff_view import DiffView
+
+
+def _make_diff_file(count: int = 50) -> DiffFile:
+    lines = [DiffLine("hunk_header", None, None, "@@ -1,1 +1,1 @@", "@@ -1,1 +1,1 @@")]
+    for i in range(1, count):
+        kind = ("context", "added", "removed")[i % 3]
+        text = f"line {i} = value"
+        lines.append(
+            DiffLine(
+                kind,
+                i if kind != "added" else None,
+                i if kind != "removed" else None,
+                text,
+                f"\x1b[34m{text}\x1b[0m",
+            )
+        )
+    return DiffFile(path="a.py", language="python", lines=lines)
+
+
+class DiffViewApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield DiffView(id="diff-view")
+
+
+@pytest.mark.asyncio
+async def test_render_reuses_base_strips_on_cursor_move() -> None:
+    """Moving the cursor restyles cached base strips instead of rebuilding."""
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        view.focus()
+        await pilot.pause()
+        built = len(view._base_strip_cache)
+        assert built > 0
+
+        await pilot.press("j", "j", "j")
+        await pilot.pause()
+        assert view.cursor == 3
+        assert len(view._base_strip_cache) == built
+
+        strip = view.render_line(3)
+        assert "line 3 = value" in strip.text
+        assert any(seg.style and seg.style.underline for seg in strip)
+
+
+@pytest.mark.asyncio
+async def test_search_highlights_current_match_column() -> None:
+    """The current search match is highlighted at its code column."""
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        await pilot.pause()
+        view.set_search("value")
+        await pilot.pause()
+
+        line_idx = view.cursor
+        strip = view.render_line(line_idx - view.scroll_offset.y)
+        current = [
+            seg.text
+            for seg in strip
+            if seg.style and seg.style.bgcolor and seg.style.bgcolor.name == "#ff8800"
+        ]
+        assert current == ["value"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_move_repaints_only_changed_rows() -> None:
+    """Moving the cursor repaints the old and new cursor rows only."""
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        view.focus()
+        await pilot.pause()
+
+        rendered: list[int] = []
+        render_line = view.render_line
+
+        def spy(y: int) -> Strip:
+            rendered.append(y)
+            return render_line(y)
+
+        view.render_line = spy  # type: ignore[method-assign]
+        await pilot.press("j")
+        await pilot.pause()
+        assert sorted(set(rendered)) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_comment_repaints_cleared_selection() -> None:
+    """Requesting a comment clears the selection and repaints its rows."""
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        view.focus()
+        await pilot.press("v", "j", "j")
+        await pilot.pause()
+        assert view.selection_range == (0, 2)
+
+        rendered: list[int] = []
+        render_line = view.render_line
+
+        def spy(y: int) -> Strip:
+            rendered.append(y)
+            return render_line(y)
+
+        view.render_line = spy  # type: ignore[method-assign]
+        await pilot.press("c")
+        await pilot.pause()
+        assert view.selection_range is None
+        assert {0, 1, 2} <= set(rendered)
+
+
+@pytest.mark.asyncio
+async def test_highlighted_code_parsed_once_per_line() -> None:
+    """Re-rendering a line with new search state reuses its parsed code."""
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        await pilot.pause()
+        parsed = view._parsed_code[2]
+        assert parsed is not None
+        assert parsed.plain == "line 2 = value"
+
+        view.set_search("line")
+        await pilot.pause()
+        assert view._parsed_code[2] is parsed
+        assert view._parsed_code[0] is None  # hunk headers are not parsed
+
+
+@pytest.mark.asyncio
+async def test_jump_to_clamps_and_scrolls() -> None:
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        await pilot.pause()
+
+        view.jump_to(40)
+        await pilot.pause()
+        assert view.cursor == 40
+        assert view.scroll_offset.y > 0
+
+        view.jump_to(500)
+        assert view.cursor == 49
+
+
+@pytest.mark.asyncio
+async def test_set_comments_patches_commented_lines() -> None:
+    """Overlapping comments keep shared lines marked until both are gone."""
+    from womtrees.diff import ReviewComment
+
+    first = ReviewComment("a.py", 2, 5, "first")
+    second = ReviewComment("a.py", 4, 6, "second")
+    other = ReviewComment("b.py", 1, 1, "elsewhere")
+
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        view.set_comments([first, second, other])
+        await pilot.pause()
+        assert view._comment_starts == [2]
+        assert view._comment_ends == [6]
+        commented = [i for i in range(10) if view._is_commented(i)]
+        assert commented == [2, 3, 4, 5, 6]
+
+        view.set_comments([second])
+        assert [i for i in range(10) if view._is_commented(i)] == [4, 5, 6]
+
+        view.set_comments([])
+        assert not any(view._is_commented(i) for i in range(10))
+
+
+@pytest.mark.asyncio
+async def test_line_chrome_built_once() -> None:
+    """Gutter and prefix are formatted once and reused on rebuilds."""
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        await pilot.pause()
+        chrome = view._line_chrome[2]
+        assert chrome is not None
+        assert chrome.plain == "   2      -"
+        assert view._line_chrome[0].plain == "@@ -1,1 +1,1 @@"
+
+        view.set_search("line")
+        await pilot.pause()
+        assert view._line_chrome[2] is chrome
+
+
+def test_parse_ansi_shared_between_identical_lines() -> None:
+    from womtrees.tui.diff_view import _parse_ansi
+
+    first = _parse_ansi("\x1b[34mpass\x1b[0m")
+    assert first.plain == "pass"
+    assert _parse_ansi("\x1b[34mpass\x1b[0m") is first
+
+
+@pytest.mark.asyncio
+async def test_long_lines_cropped_to_view_width() -> None:
+    diff_file = _make_diff_file(5)
+    diff_file.lines[1].plain_text = "x" * 200
+    diff_file.lines[1].highlighted = "x" * 200
+
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(diff_file)
+        await pilot.pause()
+        width = view.scrollable_content_region.width
+        assert view.render_line(1).cell_length == width
+        assert view.render_line(2).cell_length == width
+
+
+@pytest.mark.asyncio
+async def test_drag_moves_coalesced_into_one_cursor_update() -> None:
+    from textual.events import MouseMove, MouseUp
+
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        await pilot.mouse_down(view, offset=(5, 2))
+        assert view.selection_range == (2, 2)
+
+        for y in (3, 4, 5, 6):
+            view.on_mouse_move(MouseMove(view, 5, y, 0, 1, 1, False, False, False))
+        assert view.cursor == 2  # nothing applied until the timer fires
+        await pilot.pause(0.1)
+        assert view.selection_range == (2, 6)
+
+        view.on_mouse_move(MouseMove(view, 5, 9, 0, 3, 1, False, False, False))
+        view.on_mouse_up(MouseUp(view, 5, 9, 0, 0, 1, False, False, False))
+        assert view.selection_range == (2, 9)
+
+
+@pytest.mark.asyncio
+async def test_line_caches_sized_by_viewport() -> None:
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(_make_diff_file())
+        await pilot.pause()
+        assert view._line_cache.maxsize == 256
+
+        await pilot.resize_terminal(80, 100)
+        await pilot.pause()
+        height = view.scrollable_content_region.height
+        assert view._line_cache.maxsize == 4 * height
+        assert view._base_strip_cache.maxsize == 4 * height
+
+
+@pytest.mark.asyncio
+async def test_hunk_navigation() -> None:
+    diff_file = _make_diff_file()
+    for idx in (10, 30):
+        diff_file.lines[idx] = DiffLine("hunk_header", None, None, "@@", "@@")
+
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        view.load_file(diff_file)
+        view.focus()
+        await pilot.pause()
+        assert view._hunk_indices == [0, 10, 30]
+
+        stops = []
+        for _ in range(3):
+            await pilot.press("]")
+            stops.append(view.cursor)
+        assert stops == [10, 30, 30]
+
+        await pilot.press("j", "[")
+        assert view.cursor == 30
+        await pilot.press("[", "[", "[")
+        assert view.cursor == 0
+
+
+@pytest.mark.asyncio
+async def test_segment_path_matches_text_rendering() -> None:
+    """Base strips built from cached segments match rendering the Text."""
+    app = DiffViewApp()
+    async with app.run_test(size=(80, 20)) as pilot:
+        view = app.query_one(DiffView)
+        diff_file = _make_diff_file()
+        view.load_file(diff_file)
+        await pilot.pause()
+
+        for idx in (0, 1, 2, 3):
+            line = diff_file.lines[idx]
+            for commented in (False, True):
+                strip = view._base_strip(idx, line, 60, commented, None)
+                text = view._build_line(idx, line, commented, None)
+                expected = Strip(list(text.render(app.console)))
+                expected = expected.extend_cell_length(60, view.rich_style)
+                assert list(strip) == list(expected)
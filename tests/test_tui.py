@@ -442,3 +442,288 @@ async def test_app_help_dialog() -> None:
                     await pilot.pause()
                     # The help dialog should be on the screen stack
                     assert len(app.screen_stack) > 1
+
+
+@pytest.mark.asyncio
+async def test_slotted_dialogs_mount() -> None:
+    """Dialogs declaring __slots__ should still compose and dismiss cleanly."""
+    from textual.app import App
+
+    from womtrees.tui.comment_input import CommentInputDialog
+    from womtrees.tui.dialogs import (
+        AutoRebaseDialog,
+        CreateDialog,
+        DeleteDialog,
+        EditDialog,
+        GitActionsDialog,
+        HelpDialog,
+        MergeDialog,
+        RebaseDialog,
+    )
+
+    dialogs = [
+        CreateDialog(mode="todo", repos=[("myrepo", "/tmp/myrepo")]),
+        EditDialog("name", "feat/x", "prompt", show_prompt=True),
+        GitActionsDialog(branch="feat/x", status="review"),
+        HelpDialog(),
+        CommentInputDialog(context="a.py:1"),
+        DeleteDialog("Delete?"),
+        MergeDialog("Merge?"),
+        RebaseDialog("Rebase?"),
+        AutoRebaseDialog("Auto-rebase?"),
+    ]
+
+    app = App()
+    async with app.run_test(size=(120, 40)) as pilot:
+        for dialog in dialogs:
+            assert "__slots__" in vars(type(dialog))
+            app.push_screen(dialog)
+            await pilot.pause()
+            assert app.screen is dialog
+            await pilot.press("escape")
+            await pilot.pause()
+            assert app.screen is not dialog
+
+
+@pytest.mark.asyncio
+async def test_claude_stream_dialog_writes_plain_text() -> None:
+    """Streamed text is written literally and tool events render as dim lines."""
+    from textual.app import App
+    from textual.widgets import RichLog
+
+    from womtrees.claude import ClaudeResultEvent, ClaudeTextEvent, ClaudeToolEvent
+    from womtrees.tui.dialogs import ClaudeStreamDialog
+
+    async def fake_stream(prompt: str, cwd: str):
+        yield ClaudeTextEvent(text="see [bold]x[/bold]\npartial")
+        yield ClaudeToolEvent(tool_name="Bash", tool_input={"command": "ls"})
+        yield ClaudeResultEvent(
+            result_text="", is_error=False, cost_usd=None, session_id=None
+        )
+
+    dialog = ClaudeStreamDialog(title="t", prompt="p", cwd="/tmp")
+    app = App()
+    with patch("womtrees.claude.stream_claude_events", fake_stream):
+        async with app.run_test(size=(120, 40)) as pilot:
+            app.push_screen(dialog)
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            log = dialog.query_one("#stream-log", RichLog)
+            assert log.auto_scroll is False
+            text = "\n".join(strip.text for strip in log.lines)
+            assert "see [bold]x[/bold]" in text
+            assert "partial" in text
+            assert "▶ Bash  $ ls" in text
+            assert dialog._finished is True
+
+
+def test_cached_markup_reuses_parsed_content() -> None:
+    from womtrees.tui.dialogs.base import cached_markup
+
+    first = cached_markup("Delete #1 ([bold]feat/x[/bold])?")
+    assert cached_markup("Delete #1 ([bold]feat/x[/bold])?") is first
+    assert first.plain == "Delete #1 (feat/x)?"
+
+
+@pytest.mark.asyncio
+async def test_git_actions_dialog_rows() -> None:
+    """Action rows are parsed up front and reflect the item status."""
+    from textual.app import App
+    from textual.widgets import Static
+
+    from womtrees.tui.dialogs import GitActionsDialog
+
+    dialog = GitActionsDialog(branch="feat/x", status="working")
+    plain = [row.plain for row in dialog._action_rows]
+    assert plain[0] == "  [m]erge (review only)"
+    assert plain[3] == "  [p]ush"
+    assert plain[-1] == "  create pr [o]"
+
+    app = App()
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.push_screen(dialog)
+        await pilot.pause()
+        rows = [str(w.content) for w in dialog.query(".git-action").results(Static)]
+        assert rows == plain
+
+
+@pytest.mark.asyncio
+async def test_create_dialog_submit_resolves_repo_name() -> None:
+    """Submitting uses the repo name mapped to the selected path."""
+    from textual.app import App
+    from textual.widgets import Input, Select
+
+    from womtrees.tui.dialogs import CreateDialog
+
+    dialog = CreateDialog(
+        mode="todo",
+        repos=[("alpha", "/repos/alpha"), ("beta", "/repos/beta")],
+        default_repo=("alpha-here", "/repos/alpha"),
+    )
+    results: list[dict[str, str | None] | None] = []
+
+    app = App()
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.push_screen(dialog, results.append)
+        await pilot.pause()
+        select = dialog.query_one("#repo-select", Select)
+        assert [label for label, _ in select._options[1:]] == [
+            "alpha-here",
+            "beta",
+            "Other...",
+        ]
+        select.value = "/repos/beta"
+        dialog.query_one("#branch-input", Input).value = "feat/x"
+        await pilot.press("ctrl+s")
+        await pilot.pause()
+
+    assert results == [
+        {
+            "branch": "feat/x",
+            "prompt": None,
+            "name": None,
+            "mode": "todo",
+            "repo_name": "beta",
+            "repo_path": "/repos/beta",
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_dialog_submit_resolves_other_path(tmp_path) -> None:
+    """An "Other..." repo path is resolved off the event loop before dismissing."""
+    from textual.app import App
+    from textual.widgets import Input, Select
+
+    from womtrees.tui.dialogs import CreateDialog
+
+    repo_dir = tmp_path / "other-repo"
+    repo_dir.mkdir()
+    dialog = CreateDialog(mode="todo", repos=[("alpha", "/repos/alpha")])
+    results: list[dict[str, str | None] | None] = []
+
+    app = App()
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.push_screen(dialog, results.append)
+        await pilot.pause()
+        dialog.query_one("#repo-select", Select).value = CreateDialog._OTHER_SENTINEL
+        dialog.query_one("#repo-path-input", Input).value = str(
+            tmp_path / "." / "other-repo"
+        )
+        dialog.query_one("#branch-input", Input).value = "feat/x"
+        await pilot.press("ctrl+s")
+        await pilot.pause()
+
+    assert len(results) == 1
+    assert results[0] is not None
+    assert results[0]["repo_name"] == "other-repo"
+    assert results[0]["repo_path"] == str(repo_dir.resolve())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("dialog_name", "label", "variant", "width"),
+    [
+        ("DeleteDialog", "Delete (ctrl+s)", "error", 50),
+        ("MergeDialog", "Merge (ctrl+s)", "success", 55),
+        ("RebaseDialog", "Rebase (ctrl+s)", "warning", 55),
+        ("AutoRebaseDialog", "Auto-rebase (ctrl+s)", "error", 60),
+    ],
+)
+async def test_confirm_dialog_subclasses(
+    dialog_name: str, label: str, variant: str, width: int
+) -> None:
+    """Confirmation dialogs share ConfirmDialog and only differ in button/CSS."""
+    from textual.app import App
+    from textual.widgets import Button
+
+    from womtrees.tui import dialogs
+
+    dialog_cls = getattr(dialogs, dialog_name)
+    assert issubclass(dialog_cls, dialogs.ConfirmDialog)
+    dialog = dialog_cls("Proceed?")
+    results: list[bool | None] = []
+
+    app = App()
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.push_screen(dialog, results.append)
+        await pilot.pause()
+        button = dialog.query_one("#confirm", Button)
+        assert str(button.label) == label
+        assert button.variant == variant
+        assert dialog.query_one("#dialog").styles.width.value == width
+        await pilot.press("ctrl+s")
+        await pilot.pause()
+
+    assert results == [True]
+
+
+@pytest.mark.asyncio
+async def test_git_actions_dialog_pr_info() -> None:
+    """PR info is coloured by status and includes the URL when present."""
+    from textual.app import App
+    from textual.widgets import Static
+
+    from womtrees.models import PullRequest
+    from womtrees.tui.dialogs import GitActionsDialog
+
+    prs = [
+        PullRequest(
+            id=1,
+            work_item_id=1,
+            number=7,
+            status="open",
+            owner="o",
+            repo="r",
+            url="https://example.com/7",
+            created_at="",
+            updated_at="",
+        ),
+        PullRequest(
+            id=2,
+            work_item_id=1,
+            number=8,
+            status="draft",
+            owner="o",
+            repo="r",
+            url=None,
+            created_at="",
+            updated_at="",
+        ),
+    ]
+    dialog = GitActionsDialog(branch="feat/x", status="review", pull_requests=prs)
+
+    app = App()
+    async with app.run_test(size=(160, 40)) as pilot:
+        app.push_screen(dialog)
+        await pilot.pause()
+        info = str(dialog.query_one(".git-info", Static).content)
+        assert "PR #7 open (https://example.com/7)" in info
+        assert "PR #8 draft" in info
+
+
+@pytest.mark.asyncio
+async def test_create_dialog_submits_prompt() -> None:
+    """Text typed into the prompt TextArea is submitted with the dialog."""
+    from textual.app import App
+    from textual.widgets import Input, TextArea
+
+    from womtrees.tui.dialogs import CreateDialog
+
+    dialog = CreateDialog(mode="todo", default_repo=("alpha", "/repos/alpha"))
+    results: list[dict[str, str | None] | None] = []
+
+    app = App()
+    async with app.run_test(size=(120, 40)) as pilot:
+        app.push_screen(dialog, results.append)
+        await pilot.pause()
+        dialog.query_one("#branch-input", Input).value = "feat/x"
+        dialog.query_one("#prompt-input", TextArea).focus()
+        await pilot.pause()
+        await pilot.press("h", "i")
+        await pilot.press("ctrl+s")
+        await pilot.pause()
+
+    assert results[0] is not None
+    assert results[0]["prompt"] == "hi"
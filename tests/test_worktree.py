@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -21,23 +22,19 @@ def test_sanitize_branch_name() -> None:
     assert sanitize_branch_name("simple") == "simple"
     assert sanitize_branch_name("feat/multi/level") == "feat-multi-level"
     assert sanitize_branch_name("has spaces!@#") == "hasspaces"
+    assert sanitize_branch_name("/-lead.trail-/") == "lead.trail"
+    assert sanitize_branch_name("feat/café_ü!") == "feat-café_ü"
+    assert sanitize_branch_name("!!!") == "worktree"
 
 
-def test_get_current_repo(tmp_path, monkeypatch) -> None:
-    # Create a git repo
-    subprocess.run(["git", "init", str(tmp_path)], check=True, capture_output=True)
-    subprocess.run(
-        ["git", "-C", str(tmp_path), "commit", "--allow-empty", "-m", "init"],
-        check=True,
-        capture_output=True,
-    )
-    monkeypatch.chdir(tmp_path)
+def test_get_current_repo(git_repo, monkeypatch) -> None:
+    monkeypatch.chdir(git_repo)
 
     result = get_current_repo()
     assert result is not None
     repo_name, repo_path = result
-    assert repo_name == tmp_path.name
-    assert repo_path == str(tmp_path)
+    assert repo_name == git_repo.name
+    assert repo_path == str(git_repo)
 
 
 def test_get_current_repo_not_git(tmp_path, monkeypatch) -> None:
@@ -45,6 +42,26 @@ def test_get_current_repo_not_git(tmp_path, monkeypatch) -> None:
     assert get_current_repo() is None
 
 
+def test_get_current_repo_rechecks_after_git_init(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert get_current_repo() is None
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    assert get_current_repo() == (tmp_path.name, str(tmp_path))
+
+
+def test_parse_shortstat() -> None:
+    from womtrees.worktree import _parse_shortstat
+
+    assert _parse_shortstat(" 3 files changed, 10 insertions(+), 2 deletions(-)\n") == (
+        10,
+        2,
+    )
+    assert _parse_shortstat(" 1 file changed, 1 insertion(+)\n") == (1, 0)
+    assert _parse_shortstat(" 1 file changed, 4 deletions(-)\n") == (0, 4)
+    assert _parse_shortstat("") == (0, 0)
+
+
 # -- .womtrees.toml config loading --
 
 
@@ -89,13 +106,29 @@ def test_load_womtrees_config_local_only(tmp_path) -> None:
     assert result["scripts"]["setup"] == ["echo local"]
 
 
+def test_load_womtrees_config_cached_until_changed(tmp_path) -> None:
+    config_path = tmp_path / ".womtrees.toml"
+    config_path.write_text('[scripts]\nsetup = ["echo a"]\n')
+
+    first = load_womtrees_config(str(tmp_path))
+    assert load_womtrees_config(str(tmp_path)) is first
+
+    config_path.write_text('[scripts]\nsetup = ["echo longer"]\n')
+    result = load_womtrees_config(str(tmp_path))
+    assert result is not first
+    assert result["scripts"]["setup"] == ["echo longer"]
+
+    config_path.unlink()
+    assert load_womtrees_config(str(tmp_path)) is None
+
+
 # -- Worktree creation/removal --
 
 
-@pytest.fixture
-def git_repo(tmp_path):
-    """Create a temporary git repo with an initial commit."""
-    repo_path = tmp_path / "source_repo"
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory):
+    """Build a git repo with an initial commit once per session."""
+    repo_path = tmp_path_factory.mktemp("git_template") / "source_repo"
     repo_path.mkdir()
     subprocess.run(["git", "init", str(repo_path)], check=True, capture_output=True)
     subprocess.run(
@@ -106,6 +139,82 @@ def git_repo(tmp_path):
     return repo_path
 
 
+@pytest.fixture
+def git_repo(tmp_path, _git_repo_template):
+    """Copy the template repo, which is cheaper than running git twice."""
+    return shutil.copytree(_git_repo_template, tmp_path / "source_repo")
+
+
+def test_get_default_branch(git_repo) -> None:
+    from womtrees.worktree import clear_repo_caches, get_default_branch
+
+    repo = str(git_repo)
+    subprocess.run(["git", "-C", repo, "branch", "-M", "master"], check=True)
+    assert get_default_branch(repo) == "master"
+
+    subprocess.run(
+        ["git", "-C", repo, "update-ref", "refs/remotes/origin/develop", "HEAD"],
+        check=True,
+    )
+    subprocess.run(
+        [
+            "git",
+            "-C",
+            repo,
+            "symbolic-ref",
+            "refs/remotes/origin/HEAD",
+            "refs/remotes/origin/develop",
+        ],
+        check=True,
+    )
+    assert get_default_branch(repo) == "master"  # memoized
+    clear_repo_caches()
+    assert get_default_branch(repo) == "develop"
+
+
+def test_get_default_branch_shares_cache_across_path_spellings(
+    git_repo, tmp_path
+) -> None:
+    from womtrees.worktree import _default_branch, get_default_branch
+
+    link = tmp_path / "link"
+    link.symlink_to(git_repo)
+    _default_branch.cache_clear()
+    get_default_branch(str(git_repo))
+    get_default_branch(str(link))
+    get_default_branch(f"{git_repo}/.")
+    info = _default_branch.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_get_default_branch_with_packed_refs(git_repo) -> None:
+    from womtrees.worktree import get_default_branch
+
+    repo = str(git_repo)
+    subprocess.run(["git", "-C", repo, "branch", "-M", "master"], check=True)
+    subprocess.run(["git", "-C", repo, "pack-refs", "--all"], check=True)
+    assert not (git_repo / ".git" / "refs" / "heads" / "master").exists()
+    assert get_default_branch(repo) == "master"
+
+
+def test_get_default_branch_prefers_packed_main_over_loose_master(git_repo) -> None:
+    from womtrees.worktree import get_default_branch
+
+    repo = str(git_repo)
+    subprocess.run(["git", "-C", repo, "branch", "-M", "main"], check=True)
+    subprocess.run(["git", "-C", repo, "pack-refs", "--all"], check=True)
+    subprocess.run(["git", "-C", repo, "branch", "master"], check=True)
+    assert (git_repo / ".git" / "refs" / "heads" / "master").is_file()
+    assert get_default_branch(repo) == "main"
+
+
+def test_get_default_branch_falls_back_to_main(git_repo) -> None:
+    from womtrees.worktree import get_default_branch
+
+    subprocess.run(["git", "-C", str(git_repo), "branch", "-M", "trunk"], check=True)
+    assert get_default_branch(str(git_repo)) == "main"
+
+
 def test_create_and_remove_worktree(git_repo, tmp_path) -> None:
     base_dir = tmp_path / "worktrees"
     wt_path = create_worktree(str(git_repo), "feat/test", base_dir)
@@ -116,6 +225,62 @@ def test_create_and_remove_worktree(git_repo, tmp_path) -> None:
 
     remove_worktree(wt_path)
     assert not wt_path.exists()
+    worktrees = subprocess.run(
+        ["git", "-C", str(git_repo), "worktree", "list", "--porcelain"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert str(wt_path) not in worktrees.stdout
+
+
+def test_create_worktree_existing_branch(git_repo, tmp_path) -> None:
+    subprocess.run(
+        ["git", "-C", str(git_repo), "branch", "feat/existing"],
+        check=True,
+    )
+
+    wt_path = create_worktree(str(git_repo), "feat/existing", tmp_path / "worktrees")
+
+    head = subprocess.run(
+        ["git", "-C", str(wt_path), "branch", "--show-current"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert head.stdout.strip() == "feat/existing"
+    remove_worktree(wt_path)
+
+
+def test_has_uncommitted_changes(git_repo) -> None:
+    from womtrees.worktree import has_uncommitted_changes
+
+    repo = str(git_repo)
+    (git_repo / "tracked.txt").write_text("one")
+    (git_repo / ".gitignore").write_text("ignored.txt\n")
+    subprocess.run(["git", "-C", repo, "add", "."], check=True)
+    subprocess.run(["git", "-C", repo, "commit", "-qm", "add"], check=True)
+    assert not has_uncommitted_changes(repo)
+
+    (git_repo / "ignored.txt").write_text("x")
+    assert not has_uncommitted_changes(repo)
+
+    (git_repo / "untracked.txt").write_text("x")
+    assert has_uncommitted_changes(repo)
+    (git_repo / "untracked.txt").unlink()
+
+    (git_repo / "tracked.txt").write_text("two")
+    assert has_uncommitted_changes(repo)
+
+
+def test_create_worktree_reports_error_for_missing_branch(git_repo, tmp_path) -> None:
+    # "HEAD" is not a valid new branch name, but would check out detached
+    # if it were passed on to the existing-branch fallback.
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        create_worktree(str(git_repo), "HEAD", tmp_path / "worktrees")
+
+    assert "-b" in exc_info.value.cmd
+    assert not (tmp_path / "worktrees" / git_repo.name / "HEAD").exists()
 
 
 def test_create_worktree_with_setup(git_repo, tmp_path) -> None:
@@ -140,6 +305,40 @@ def test_create_worktree_with_setup(git_repo, tmp_path) -> None:
     remove_worktree(wt_path)
 
 
+def test_create_worktree_parallel_setup(git_repo, tmp_path) -> None:
+    (git_repo / ".env").write_text("SECRET=123")
+    (git_repo / ".womtrees.toml").write_text(
+        '[copy]\nfiles = [".env"]\n\n'
+        '[scripts]\nsetup_parallel = true\nsetup = ["echo ran > .setup_marker"]\n',
+    )
+
+    wt_path = create_worktree(str(git_repo), "feat/parallel", tmp_path / "worktrees")
+
+    assert (wt_path / ".env").read_text() == "SECRET=123"
+    assert (wt_path / ".setup_marker").read_text() == "ran\n"
+    remove_worktree(wt_path)
+
+
+def test_create_worktree_parallel_copy_failure_rolls_back(
+    git_repo, tmp_path, monkeypatch
+) -> None:
+    (git_repo / ".womtrees.toml").write_text(
+        '[copy]\nfiles = [".env"]\n\n'
+        '[scripts]\nsetup_parallel = true\nsetup = ["echo ran > .setup_marker"]\n',
+    )
+
+    def fail_copy(*args, **kwargs) -> None:
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr("womtrees.worktree._run_womtrees_copy", fail_copy)
+
+    base_dir = tmp_path / "worktrees"
+    with pytest.raises(OSError, match="No space left"):
+        create_worktree(str(git_repo), "feat/copy-fails", base_dir)
+
+    assert not (base_dir / git_repo.name / "feat-copy-fails").exists()
+
+
 def test_create_worktree_setup_failure_rolls_back(git_repo, tmp_path) -> None:
     (git_repo / ".womtrees.toml").write_text('[scripts]\nsetup = ["exit 1"]\n')
 
@@ -161,6 +360,96 @@ def test_create_worktree_setup_failure_rolls_back(git_repo, tmp_path) -> None:
     exc_info.value.log_path.unlink()
 
 
+def test_run_womtrees_copy_multiple_entries(tmp_path) -> None:
+    from womtrees.worktree import _run_womtrees_copy
+
+    repo = tmp_path / "repo"
+    (repo / "conf").mkdir(parents=True)
+    (repo / ".env").write_text("A=1")
+    (repo / "conf" / "app.ini").write_text("[app]")
+    (repo / "nested").mkdir()
+    (repo / "nested" / "key.pem").write_text("key")
+    worktree = tmp_path / "wt"
+    worktree.mkdir()
+
+    config = {"copy": {"files": [".env", "conf", "nested/key.pem", "missing"]}}
+    _run_womtrees_copy(config, str(repo), worktree)
+
+    assert (worktree / ".env").read_text() == "A=1"
+    assert (worktree / "conf" / "app.ini").read_text() == "[app]"
+    assert (worktree / "nested" / "key.pem").read_text() == "key"
+    assert not (worktree / "missing").exists()
+
+
+@pytest.mark.parametrize("mode", ["link", "hardlink", "reflink"])
+def test_run_womtrees_copy_modes(tmp_path, mode) -> None:
+    from womtrees.worktree import _run_womtrees_copy
+
+    repo = tmp_path / "repo"
+    (repo / "cache").mkdir(parents=True)
+    (repo / "cache" / "blob").write_text("data")
+    (repo / ".env").write_text("A=1")
+    worktree = tmp_path / "wt"
+    worktree.mkdir()
+
+    config = {"copy": {"files": [".env", "cache"], "mode": mode}}
+    _run_womtrees_copy(config, str(repo), worktree)
+
+    assert (worktree / ".env").read_text() == "A=1"
+    assert (worktree / "cache" / "blob").read_text() == "data"
+    if mode in ("link", "hardlink"):
+        assert (worktree / ".env").samefile(repo / ".env")
+    else:
+        assert not (worktree / ".env").samefile(repo / ".env")
+
+
+def test_run_womtrees_copy_link_rerun_into_existing_tree(tmp_path) -> None:
+    from womtrees.worktree import _run_womtrees_copy
+
+    repo = tmp_path / "repo"
+    (repo / "cache").mkdir(parents=True)
+    (repo / "cache" / "blob").write_text("data")
+    worktree = tmp_path / "wt"
+    worktree.mkdir()
+
+    config = {"copy": {"files": ["cache"], "mode": "link"}}
+    _run_womtrees_copy(config, str(repo), worktree)
+    _run_womtrees_copy(config, str(repo), worktree)
+
+    assert (worktree / "cache" / "blob").samefile(repo / "cache" / "blob")
+
+
+def test_create_worktree_rejects_unknown_copy_mode(git_repo, tmp_path) -> None:
+    (git_repo / ".womtrees.toml").write_text(
+        '[copy]\nfiles = [".env"]\nmode = "symlink"\n'
+    )
+
+    base_dir = tmp_path / "worktrees"
+    with pytest.raises(ValueError, match="Unknown \\[copy\\] mode 'symlink'"):
+        create_worktree(str(git_repo), "feat/bad-mode", base_dir)
+
+    assert not (base_dir / git_repo.name / "feat-bad-mode").exists()
+
+
+def test_discover_repo_path(tmp_path) -> None:
+    from womtrees.worktree import _discover_repo_path
+
+    main = tmp_path / "main"
+    (main / ".git").mkdir(parents=True)
+    assert _discover_repo_path(main) is None
+    assert _discover_repo_path(tmp_path / "gone") is None
+
+    linked = tmp_path / "linked"
+    linked.mkdir()
+    (linked / ".git").write_text(f"gitdir: {main}/.git/worktrees/linked\n")
+    assert _discover_repo_path(linked) == main
+
+    # A rewritten .git file is picked up rather than served from the cache
+    other = tmp_path / "other"
+    (linked / ".git").write_text(f"gitdir: {other}/.git/worktrees/linked-2\n")
+    assert _discover_repo_path(linked) == other
+
+
 def test_setup_success_cleans_log(git_repo, tmp_path) -> None:
     (git_repo / ".womtrees.toml").write_text('[scripts]\nsetup = ["echo ok"]\n')
 
@@ -176,6 +465,27 @@ def test_setup_success_cleans_log(git_repo, tmp_path) -> None:
     remove_worktree(wt_path)
 
 
+def test_run_scripts_logs_each_command_and_stops_at_failure(tmp_path) -> None:
+    from womtrees.worktree import _run_scripts
+
+    commands = [
+        "cd / && export LEAK=1",
+        'pwd; echo "leak=$LEAK"; echo oops >&2',
+        "exit 3",
+        "touch never",
+    ]
+    result = _run_scripts(commands, tmp_path, "/repo", "setup", "feat/batch")
+
+    assert not result.success
+    assert result.log_path is not None
+    log = result.log_path.read_text()
+    result.log_path.unlink()
+    assert f'$ pwd; echo "leak=$LEAK"; echo oops >&2\n{tmp_path}\nleak=\noops\n' in log
+    assert "exit: 3\n\nRESULT: FAILED at command 3\n" in log
+    assert "touch never" not in log
+    assert not (tmp_path / "never").exists()
+
+
 # -- Teardown scripts --
 
 